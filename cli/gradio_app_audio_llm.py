@@ -1,7 +1,7 @@
 import os
 import gradio as gr
 
-from core.editor.session import Session
+from core.editor.session import EditorSession
 from core.score import load_musicxml
 from core.audio import render_audio_with_tuning
 from core.editor.dummy_llm import DummyLLM
@@ -10,7 +10,7 @@ from core.editor.dummy_llm import DummyLLM
 # Global session + dummy LLM
 # -------------------------------------------------
 
-session = Session()
+session = EditorSession()
 llm = DummyLLM()
 
 
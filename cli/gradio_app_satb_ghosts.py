@@ -1,6 +1,6 @@
 import gradio as gr
 
-from core.score import load_musicxml, write_musicxml, replace_chord_in_measure
+from core.score import load_musicxml, write_musicxml
 from core.editor.session import EditorSession
 from core.llm.ghost_generator import generate_ghost_chords
 
@@ -28,13 +28,10 @@ def accept_ghost(session, selected_index):
     if session is None or selected_index is None:
         return session, "Keine Auswahl / Session."
     try:
-        ghost = session.ghosts.chords[int(selected_index)]
+        ghost = session.ghosts[int(selected_index)]
     except IndexError:
         return session, "Ungültiger Index."
-    score = session.current_score
-    replace_chord_in_measure(score, ghost.measure, ghost.root)
-    session.apply(score)
-    session.ghosts.chords.pop(int(selected_index))
+    session.accept_ghost(ghost)
     return session, f"Ghost Takt {ghost.measure} akzeptiert."
 
 
@@ -42,7 +39,7 @@ def reject_ghost(session, selected_index):
     if session is None or selected_index is None:
         return session, "Keine Auswahl / Session."
     try:
-        ghost = session.ghosts.chords.pop(int(selected_index))
+        ghost = session.ghosts.pop(int(selected_index))
         return session, f"Ghost Takt {ghost.measure} verworfen."
     except IndexError:
         return session, "Ungültiger Index."
@@ -1,6 +1,6 @@
 import gradio as gr
 
-from core.score import load_musicxml, write_musicxml, replace_chord_in_measure
+from core.score import load_musicxml, write_musicxml
 from core.editor.session import EditorSession
 
 
@@ -14,9 +14,7 @@ def apply_edit(session, measure, root):
     if session is None:
         return None, "Keine Session aktiv."
 
-    score = session.current_score
-    replace_chord_in_measure(score, int(measure), root)
-    session.apply(score)
+    session.replace_chord(int(measure), root)
     return session, f"Takt {measure} geändert."
 
 
@@ -24,7 +22,8 @@ def undo(session):
     if session is None:
         return None, "Keine Session aktiv."
 
-    session.undo()
+    if not session.undo():
+        return session, "Nichts rückgängig zu machen."
     return session, "Undo."
 
 
@@ -32,7 +31,8 @@ def redo(session):
     if session is None:
         return None, "Keine Session aktiv."
 
-    session.redo()
+    if not session.redo():
+        return session, "Nichts wiederherzustellen."
     return session, "Redo."
 
 
@@ -1,7 +1,6 @@
 import subprocess
 import tempfile
 from mido import MidiFile, MidiTrack, Message
-from copy import deepcopy
 from pathlib import Path
 from core.config import get_config
 
@@ -28,11 +27,11 @@ def adjust_midi_for_tuning(midi_path, base_tuning=432.0):
         for msg in track:
             if msg.type == 'note_on' or msg.type == 'note_off':
                 new_note = int(msg.note * factor)
-                new_msg = deepcopy(msg)
-                new_msg.note = max(0, min(127, new_note))
-                new_track.append(new_msg)
+                new_track.append(msg.copy(note=max(0, min(127, new_note))))
             else:
-                new_track.append(deepcopy(msg))
+                # mid is private to this function, so its messages can be
+                # moved over without copying
+                new_track.append(msg)
         new_mid.tracks.append(new_track)
 
     # Save to temporary file
@@ -6,8 +6,11 @@ and proper validation to ensure consistent configuration handling.
 """
 
 import os
+import stat
+import tempfile
 import yaml
-from dataclasses import dataclass, field, asdict
+from contextlib import suppress
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
 
@@ -18,6 +21,11 @@ from core.constants import (
 from core.validation import validate_base_tuning
 from core.exceptions import ConfigurationError
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
 
 @dataclass
 class AudioConfig:
@@ -28,7 +36,9 @@ class AudioConfig:
     sample_rate: int = AudioDefaults.SAMPLE_RATE
     bit_depth: int = AudioDefaults.BIT_DEPTH
     channels: int = AudioDefaults.CHANNELS
-    voice_ranges: Dict[str, Dict[str, int]] = field(default_factory=lambda: AudioDefaults.VOICE_RANGES.copy())
+    voice_ranges: Dict[str, Dict[str, int]] = field(default_factory=lambda: {
+        voice: dict(voice_range) for voice, voice_range in AudioDefaults.VOICE_RANGES.items()
+    })
     
     def __post_init__(self):
         """Validate audio configuration after initialization."""
@@ -49,6 +59,38 @@ class AudioConfig:
         if self.base_tuning not in self.tuning_options:
             self.tuning_options.append(self.base_tuning)
             self.tuning_options.sort()
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'base_tuning': self.base_tuning,
+            'tuning_options': list(self.tuning_options),
+            'default_soundfont': self.default_soundfont,
+            'sample_rate': self.sample_rate,
+            'bit_depth': self.bit_depth,
+            'channels': self.channels,
+            'voice_ranges': {voice: dict(limits) for voice, limits in self.voice_ranges.items()}
+        }
+
+
+def _check_llm_range(name: str, value: float, low: float, high: float) -> None:
+    """Check that an LLM setting lies within [low, high].
+    
+    Args:
+        name: Setting name below the ``llm`` section
+        value: Value to check
+        low: Minimum allowed value
+        high: Maximum allowed value
+        
+    Raises:
+        ConfigurationError: If the value is out of range
+    """
+    if not low <= value <= high:
+        raise ConfigurationError(
+            f"LLM {name} must be between {low} and {high}, got {value}",
+            config_key=f"llm.{name}",
+            config_value=value
+        )
 
 
 @dataclass
@@ -65,21 +107,9 @@ class LLMConfig:
     
     def __post_init__(self):
         """Validate LLM configuration after initialization."""
-        # Validate temperature
-        if not 0.0 <= self.temperature <= 2.0:
-            raise ConfigurationError(
-                f"LLM temperature must be between 0.0 and 2.0, got {self.temperature}",
-                config_key="llm.temperature",
-                config_value=self.temperature
-            )
-        
-        # Validate top_p
-        if not 0.0 <= self.top_p <= 1.0:
-            raise ConfigurationError(
-                f"LLM top_p must be between 0.0 and 1.0, got {self.top_p}",
-                config_key="llm.top_p",
-                config_value=self.top_p
-            )
+        # Validate temperature and top_p
+        _check_llm_range("temperature", self.temperature, 0.0, 2.0)
+        _check_llm_range("top_p", self.top_p, 0.0, 1.0)
         
         # Validate timeout
         if self.timeout <= 0:
@@ -88,6 +118,19 @@ class LLMConfig:
                 config_key="llm.timeout",
                 config_value=self.timeout
             )
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'top_p': self.top_p,
+            'timeout': self.timeout,
+            'voice_prompts': dict(self.voice_prompts),
+            'service_url': self.service_url,
+            'api_key': self.api_key,
+            'model_name': self.model_name
+        }
 
 
 @dataclass
@@ -111,6 +154,19 @@ class UIConfig:
         # Validate file size
         if self.max_file_size < 1:
             self.max_file_size = UIDefaults.MAX_FILE_SIZE
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'theme': self.theme,
+            'cache_examples': self.cache_examples,
+            'analytics_enabled': self.analytics_enabled,
+            'show_progress': self.show_progress,
+            'concurrency_count': self.concurrency_count,
+            'max_file_size': self.max_file_size,
+            'max_files': self.max_files,
+            'language': self.language
+        }
 
 
 @dataclass
@@ -136,6 +192,15 @@ class SessionConfig:
         
         if self.session_timeout < 60:
             self.session_timeout = SessionDefaults.SESSION_TIMEOUT
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'max_undo_steps': self.max_undo_steps,
+            'auto_save_interval': self.auto_save_interval,
+            'session_timeout': self.session_timeout,
+            'session_dir': str(self.session_dir)
+        }
 
 
 @dataclass
@@ -158,6 +223,17 @@ class LoggingConfig:
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.level.upper() not in valid_levels:
             self.level = LoggingDefaults.LEVEL
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'level': self.level,
+            'format': self.format,
+            'date_format': self.date_format,
+            'max_file_size': self.max_file_size,
+            'backup_count': self.backup_count,
+            'log_file': str(self.log_file) if self.log_file else None
+        }
 
 
 @dataclass
@@ -170,12 +246,26 @@ class PathConfig:
     locales_dir: Path = field(default_factory=lambda: PathDefaults.LOCALES_DIR)
     examples_dir: Path = field(default_factory=lambda: PathDefaults.EXAMPLES_DIR)
     
+    # Names of the Path-typed fields above, normalized in __post_init__
+    _PATH_FIELDS = ('config_dir', 'cache_dir', 'log_dir', 'temp_dir', 'locales_dir', 'examples_dir')
+    
     def __post_init__(self):
         """Ensure all paths are Path objects."""
-        for attr_name in ['config_dir', 'cache_dir', 'log_dir', 'temp_dir', 'locales_dir', 'examples_dir']:
-            attr_value = getattr(self, attr_name)
-            if isinstance(attr_value, str):
-                setattr(self, attr_name, Path(attr_value))
+        values = self.__dict__
+        for attr_name in self._PATH_FIELDS:
+            if type(values[attr_name]) is str:
+                values[attr_name] = Path(values[attr_name])
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'config_dir': str(self.config_dir),
+            'cache_dir': str(self.cache_dir),
+            'log_dir': str(self.log_dir),
+            'temp_dir': str(self.temp_dir),
+            'locales_dir': str(self.locales_dir),
+            'examples_dir': str(self.examples_dir)
+        }
 
 
 @dataclass
@@ -196,6 +286,15 @@ class APIConfig:
         
         if self.retry_delay < 0:
             self.retry_delay = APIDefaults.RETRY_DELAY
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'timeout': self.timeout,
+            'max_retries': self.max_retries,
+            'retry_delay': self.retry_delay,
+            'user_agent': self.user_agent
+        }
 
 
 @dataclass
@@ -207,6 +306,17 @@ class FeatureConfig:
     enable_ghost_chords: bool = FeatureFlags.ENABLE_GHOST_CHORDS
     enable_collaboration: bool = FeatureFlags.ENABLE_COLLABORATION
     enable_advanced_analysis: bool = FeatureFlags.ENABLE_ADVANCED_ANALYSIS
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization."""
+        return {
+            'enable_llm_integration': self.enable_llm_integration,
+            'enable_audio_rendering': self.enable_audio_rendering,
+            'enable_session_management': self.enable_session_management,
+            'enable_ghost_chords': self.enable_ghost_chords,
+            'enable_collaboration': self.enable_collaboration,
+            'enable_advanced_analysis': self.enable_advanced_analysis
+        }
 
 
 @dataclass
@@ -223,16 +333,36 @@ class AppConfig:
     
     def __post_init__(self):
         """Create necessary directories after initialization."""
-        # Create essential directories
-        for dir_path in [
+        # Create essential directories. Duplicates are dropped and parents
+        # are created before children, so each mkdir finds its parent in
+        # place and never has to walk the chain again.
+        essential_dirs = {
             self.paths.config_dir,
             self.paths.cache_dir,
             self.paths.log_dir,
             self.session.session_dir
-        ]:
+        }
+        for dir_path in sorted(essential_dirs, key=lambda p: len(p.parts)):
             dir_path.mkdir(parents=True, exist_ok=True)
 
 
+def _config_file_mode(config_file: Path) -> int:
+    """Permission bits for a rewritten configuration file.
+    
+    Args:
+        config_file: Path of the configuration file being written
+        
+    Returns:
+        The existing file's mode, or the umask-adjusted default for new files
+    """
+    try:
+        return stat.S_IMODE(os.stat(config_file).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
 class ConfigManager:
     """Manages application configuration loading and saving."""
     
@@ -306,8 +436,28 @@ class ConfigManager:
             # Convert config to dictionary and save
             config_dict = self._config_to_dict(self.config)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            # Write to a temporary file next to the target and rename it
+            # into place, so a failed write never leaves a partial file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.config_file.parent, prefix=".config-", suffix=".tmp"
+            )
+            f = None
+            try:
+                # mkstemp creates the file 0600; keep the mode a plain
+                # write would have given the configuration file
+                os.chmod(tmp_path, _config_file_mode(self.config_file))
+                f = open(fd, 'wb', buffering=1 << 16)
+                with f:
+                    yaml.dump(config_dict, f, Dumper=_YamlDumper,
+                              default_flow_style=False, indent=2,
+                              encoding='utf-8')
+                os.replace(tmp_path, self.config_file)
+            except BaseException:
+                if f is None:
+                    os.close(fd)
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
         
         except IOError as e:
             raise ConfigurationError(
@@ -328,15 +478,25 @@ class ConfigManager:
         
         Args:
             **kwargs: Configuration values to update
+            
+        Raises:
+            ConfigurationError: If a section update names an unknown field
         """
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 config_section = getattr(self.config, key)
-                if isinstance(value, dict) and hasattr(config_section, '__dict__'):
-                    # Update nested configuration
-                    for sub_key, sub_value in value.items():
-                        if hasattr(config_section, sub_key):
-                            setattr(config_section, sub_key, sub_value)
+                if isinstance(value, dict) and is_dataclass(config_section):
+                    field_names = {f.name for f in fields(config_section)}
+                    unknown = sorted(set(value) - field_names)
+                    if unknown:
+                        raise ConfigurationError(
+                            f"Unknown {key} configuration field(s): {', '.join(unknown)}",
+                            config_key=f"{key}.{unknown[0]}",
+                            config_value=value[unknown[0]]
+                        )
+                    # Rebuild the nested configuration in one step, so its
+                    # __post_init__ validation also covers the new values
+                    setattr(self.config, key, replace(config_section, **value))
                 else:
                     # Set top-level configuration
                     setattr(self.config, key, value)
@@ -391,21 +551,14 @@ class ConfigManager:
             Configuration dictionary
         """
         return {
-            'audio': asdict(config.audio),
-            'llm': asdict(config.llm),
-            'ui': asdict(config.ui),
-            'session': asdict(config.session),
-            'logging': asdict(config.logging),
-            'paths': {
-                'config_dir': str(config.paths.config_dir),
-                'cache_dir': str(config.paths.cache_dir),
-                'log_dir': str(config.paths.log_dir),
-                'temp_dir': str(config.paths.temp_dir),
-                'locales_dir': str(config.paths.locales_dir),
-                'examples_dir': str(config.paths.examples_dir)
-            },
-            'api': asdict(config.api),
-            'features': asdict(config.features)
+            'audio': config.audio._to_dict(),
+            'llm': config.llm._to_dict(),
+            'ui': config.ui._to_dict(),
+            'session': config.session._to_dict(),
+            'logging': config.logging._to_dict(),
+            'paths': config.paths._to_dict(),
+            'api': config.api._to_dict(),
+            'features': config.features._to_dict()
         }
 
 
@@ -5,6 +5,7 @@ This module contains all application-wide constants, default values,
 and configuration parameters to ensure consistency across the codebase.
 """
 
+import sys
 from pathlib import Path
 from typing import Dict, List
 
@@ -13,6 +14,13 @@ APP_NAME = "Choral LLM Workbench"
 APP_VERSION = "0.1.0"
 APP_DESCRIPTION = "AI-assisted choral music composition and harmonization"
 
+# Voice names, interned so that voice-keyed tables below compare keys by
+# identity when looked up with names interned at the input boundary
+SOPRANO = sys.intern("soprano")
+ALTO = sys.intern("alto")
+TENOR = sys.intern("tenor")
+BASS = sys.intern("bass")
+
 # File extensions and formats
 class FileExtensions:
     MUSICXML = ".xml"
@@ -37,10 +45,10 @@ class AudioDefaults:
     
     # Voice ranges (in MIDI note numbers)
     VOICE_RANGES = {
-        "soprano": {"min": 60, "max": 84},  # C4 to C6
-        "alto": {"min": 55, "max": 79},     # G3 to G5
-        "tenor": {"min": 48, "max": 72},    # C3 to C5
-        "bass": {"min": 40, "max": 64}      # E2 to E4
+        SOPRANO: {"min": 60, "max": 84},  # C4 to C6
+        ALTO: {"min": 55, "max": 79},     # G3 to G5
+        TENOR: {"min": 48, "max": 72},    # C3 to C5
+        BASS: {"min": 40, "max": 64}      # E2 to E4
     }
 
 # LLM configuration
@@ -49,13 +57,14 @@ class LLMDefaults:
     TEMPERATURE = 0.7
     TOP_P = 0.9
     TIMEOUT = 30  # seconds
+    KEEP_ALIVE = "10m"  # how long Ollama keeps the model loaded between prompts
     
     # Voice-specific prompt templates
     VOICE_PROMPTS = {
-        "soprano": "Create a soprano line that harmonizes with the given chords: {prompt}",
-        "alto": "Create an alto line that harmonizes with the given chords: {prompt}",
-        "tenor": "Create a tenor line that harmonizes with the given chords: {prompt}",
-        "bass": "Create a bass line that harmonizes with the given chords: {prompt}"
+        SOPRANO: "Create a soprano line that harmonizes with the given chords: {prompt}",
+        ALTO: "Create an alto line that harmonizes with the given chords: {prompt}",
+        TENOR: "Create a tenor line that harmonizes with the given chords: {prompt}",
+        BASS: "Create a bass line that harmonizes with the given chords: {prompt}"
     }
 
 # UI configuration
@@ -128,18 +137,20 @@ class SuccessMessages:
 
 # Voice information
 class VoiceInfo:
-    SATB_VOICES = ["soprano", "alto", "tenor", "bass"]
+    SATB_VOICES = [SOPRANO, ALTO, TENOR, BASS]
+    SATB_VOICES_SET = frozenset(SATB_VOICES)
+    SATB_VOICES_STR = ", ".join(SATB_VOICES)
     VOICE_COLORS = {
-        "soprano": "#FF6B6B",  # Red
-        "alto": "#4ECDC4",     # Teal
-        "tenor": "#45B7D1",    # Blue
-        "bass": "#96CEB4"      # Green
+        SOPRANO: "#FF6B6B",  # Red
+        ALTO: "#4ECDC4",     # Teal
+        TENOR: "#45B7D1",    # Blue
+        BASS: "#96CEB4"      # Green
     }
     VOICE_ABBREVIATIONS = {
-        "soprano": "S",
-        "alto": "A", 
-        "tenor": "T",
-        "bass": "B"
+        SOPRANO: "S",
+        ALTO: "A", 
+        TENOR: "T",
+        BASS: "B"
     }
 
 # Path configuration
@@ -7,6 +7,13 @@ class DummyLLM:
     Returns fixed harmonization outputs, optionally per voice.
     """
 
+    # Fixed harmonization; callers always get a fresh copy
+    _RESULT_TEMPLATE: Dict[str, Any] = {
+        "measure": 1,
+        "root": "C",
+        "quality": "major"
+    }
+
     def __init__(self):
         # Optional: kann internal state oder history speichern
         self.history = []
@@ -27,13 +34,7 @@ class DummyLLM:
         self.history.append({"prompt": prompt, "voice": voice})
 
         # Dummy harmonization: immer Measure 1, Root C, Quality major
-        result = {
-            "measure": 1,
-            "root": "C",
-            "quality": "major"
-        }
-
-        return result
+        return dict(self._RESULT_TEMPLATE)
     
     def harmonize_multi_voice(self, prompts: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -45,18 +46,13 @@ class DummyLLM:
         Returns:
             dict: Dictionary with voice suggestions
         """
-        # Store all prompts in history
-        for voice, prompt in prompts.items():
-            self.history.append({"prompt": prompt, "voice": voice})
-        
-        # Generate dummy suggestions for each voice
+        template = self._RESULT_TEMPLATE
+        history = self.history
+
+        # Store each prompt in history and build its dummy suggestion in one pass
         suggestions = {}
         for voice, prompt in prompts.items():
-            suggestions[voice] = {
-                "measure": 1,
-                "root": "C",
-                "quality": "major",
-                "prompt_used": prompt
-            }
-        
+            history.append({"prompt": prompt, "voice": voice})
+            suggestions[voice] = {**template, "prompt_used": prompt}
+
         return suggestions
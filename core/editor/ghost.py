@@ -1,25 +1,64 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
 
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class GhostChord:
     measure: int
     root: str
     quality: str = "major"
+    # Display label, built once since ghosts are immutable
+    _label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_label", f"Takt {self.measure}: {self.root} {self.quality}"
+        )
 
     def label(self):
-        return f"Takt {self.measure}: {self.root} {self.quality}"
+        return self._label
 
 
 class GhostLayer:
     def __init__(self):
-        self.chords = []
+        # Keyed by id() so a ghost can be removed without scanning the layer;
+        # dicts keep insertion order for the UI listing
+        self._chords = {}
+
+    @property
+    def chords(self):
+        """Ghosts in insertion order (read-only; use pop/discard to remove)."""
+        return tuple(self._chords.values())
+
+    def __len__(self):
+        return len(self._chords)
+
+    def __getitem__(self, index: int) -> GhostChord:
+        """Ghost at a position in insertion order, without copying the layer."""
+        size = len(self._chords)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ghost index out of range")
+        return next(islice(self._chords.values(), index, None))
 
     def add(self, ghost: GhostChord):
-        self.chords.append(ghost)
+        self._chords[id(ghost)] = ghost
+
+    def discard(self, ghost: GhostChord):
+        self._chords.pop(id(ghost), None)
+
+    def pop(self, index: int) -> GhostChord:
+        ghost = self[index]
+        del self._chords[id(ghost)]
+        return ghost
 
     def clear(self):
-        self.chords = []
+        self._chords.clear()
 
     def list_labels(self):
-        return [g.label() for g in self.chords]
+        return [g._label for g in self._chords.values()]
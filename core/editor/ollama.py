@@ -1,16 +1,40 @@
 import subprocess
-from typing import List
+import time
+from typing import Dict, List
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # requests is optional; fall back to the CLI
+    requests = None
 
 # Optional: Du kannst hier deinen bevorzugten LLM-Wrapper importieren
 # Beispiel: from llm_ollama import OllamaLLM
 
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
 
-def list_ollama_models() -> List[str]:
+# Keep-alive session for the Ollama HTTP API, created on first use
+_SESSION = None
+
+# Seconds a model list is reused before Ollama is asked again
+MODEL_LIST_TTL = 5.0
+
+# (time.monotonic() of the lookup, model names) of the last lookup
+_model_cache = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
+def _list_models_cli() -> List[str]:
     """
-    List all locally installed Ollama models.
-    
-    Returns:
-        List of model names as strings.
+    List installed models by running ``ollama list``.
     """
     try:
         result = subprocess.run(
@@ -20,8 +44,8 @@ def list_ollama_models() -> List[str]:
             check=True
         )
         lines = result.stdout.splitlines()
-        # Filter empty lines and header lines
-        models = [line.strip() for line in lines if line.strip() and not line.startswith("Name")]
+        # Filter empty lines and header lines, keep the name column
+        models = [line.split()[0] for line in lines if line.strip() and not line.startswith("NAME")]
         return models
     except subprocess.CalledProcessError as e:
         print("Error listing Ollama models:", e)
@@ -31,25 +55,73 @@ def list_ollama_models() -> List[str]:
         return []
 
 
+def invalidate_ollama_cache() -> None:
+    """
+    Forget the cached model list, e.g. after ``ollama pull``.
+    """
+    global _model_cache
+    _model_cache = None
+
+
+def list_ollama_models() -> List[str]:
+    """
+    List all locally installed Ollama models.
+
+    Queries the running Ollama server over HTTP; the ``ollama`` CLI is only
+    used when the server cannot be reached or requests is not installed.
+    The result is reused for ``MODEL_LIST_TTL`` seconds.
+    
+    Returns:
+        List of model names as strings.
+    """
+    global _model_cache
+    now = time.monotonic()
+    if _model_cache is not None and now - _model_cache[0] < MODEL_LIST_TTL:
+        return list(_model_cache[1])
+    models = _fetch_models()
+    _model_cache = (now, tuple(models))
+    return models
+
+
+def _fetch_models() -> List[str]:
+    """
+    Look up the installed models, preferring the HTTP API.
+    """
+    if requests is not None:
+        try:
+            response = _get_session().get(OLLAMA_TAGS_URL, timeout=2)
+            response.raise_for_status()
+            return [model["name"] for model in response.json()["models"]]
+        except requests.exceptions.ConnectionError:
+            pass
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            print("Error listing Ollama models:", e)
+            return []
+    return _list_models_cli()
+
+
 class OllamaDummyLLM:
     """
     Minimal dummy wrapper for testing.
     In production, replace with a proper LLM client for Ollama.
     """
+    # Fixed SATB output; callers always get a fresh copy
+    _SATB_RESULT: Dict[str, Dict[str, object]] = {
+        "S": {"measure": 1, "root": "C", "quality": "major"},
+        "A": {"measure": 1, "root": "G", "quality": "major"},
+        "T": {"measure": 1, "root": "E", "quality": "major"},
+        "B": {"measure": 1, "root": "C", "quality": "major"},
+    }
+
     def __init__(self, model_name: str):
         self.model_name = model_name
 
-    def harmonize_prompt(self, prompt: str) -> dict:
+    def harmonize_prompt(self, prompt: str) -> Dict[str, Dict[str, object]]:
         """
         Fake harmonization output for testing purposes.
         Replace this with a real call to Ollama LLM.
         """
-        return {
-            "S": {"measure": 1, "root": "C", "quality": "major"},
-            "A": {"measure": 1, "root": "G", "quality": "major"},
-            "T": {"measure": 1, "root": "E", "quality": "major"},
-            "B": {"measure": 1, "root": "C", "quality": "major"},
-        }
+        return {voice: dict(result) for voice, result in self._SATB_RESULT.items()}
 
 
 def get_ollama_llm(model_name: str):
@@ -1,49 +1,210 @@
 # core/editor/session.py
 
+from collections import deque
+from contextlib import contextmanager
 from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+from core.constants import SessionDefaults
+from core.editor.ghost import GhostChord, GhostLayer
+from core.score.reharmonize import replace_chord_in_measure
+from core.score.utils import fast_clone_score
+
+
+@dataclass
+class ScoreDelta:
+    """
+    A chord edit confined to one measure number of a score.
+
+    Instead of a full score snapshot, the delta keeps the affected measure
+    of each part before and after the edit. Undo and redo swap these
+    measures in place, so neither needs to copy anything. A delta made on
+    a fresh clone of the previous snapshot has no swaps: undo simply
+    returns to that snapshot.
+    """
+    score: Any
+    measure: int
+    # (part, measure before the edit, measure after the edit)
+    swaps: List[Tuple[Any, Any, Any]]
+
+    def revert(self):
+        """Put the measures from before the edit back into their parts."""
+        for part, before, after in self.swaps:
+            part.replace(after, before)
+
+    def reapply(self):
+        """Put the edited measures back into their parts."""
+        for part, before, after in self.swaps:
+            part.replace(before, after)
+
 
 class EditorSession:
     """
     Holds the current score, history, and future states
     for undo/redo functionality.
+
+    The history holds two kinds of entries:
+
+    - full score snapshots (from ``load_score``, ``save_state``,
+      ``apply_edit`` and ``mutate``), treated as immutable and shared by
+      reference (copy-on-write);
+    - ``ScoreDelta`` entries (from ``replace_chord``), which record a
+      single-measure change to the current score.
+
+    At most ``max_undo_steps`` changes are kept; older ones are dropped.
+    A ``score`` passed to the constructor is loaded right away.
     """
 
-    def __init__(self):
+    def __init__(self, score=None, max_undo_steps=SessionDefaults.MAX_UNDO_STEPS):
         self.current_score = None
-        self.history = []
-        self.future = []
+        # The oldest entry is the base state, so keep one more than the steps
+        self.history = deque(maxlen=max_undo_steps + 1)
+        self.future = deque()
+        # True while current_score may be a snapshot in the history and
+        # therefore must not be edited in place
+        self._shared = False
+        # Chord suggestions not yet accepted or rejected
+        self.ghosts = GhostLayer()
+        if score is not None:
+            self.load_score(score)
 
     def load_score(self, score):
         """
         Load a score into the session and reset history.
+
+        The session does not copy the score; callers must not modify it
+        in place afterwards.
         """
-        self.current_score = deepcopy(score)
-        self.history = [deepcopy(score)]
-        self.future = []
+        self.current_score = score
+        self.history.clear()
+        self.history.append(score)
+        self.future.clear()
+        self._shared = True
 
     def save_state(self):
         """
         Save current score state to history.
         """
-        self.history.append(deepcopy(self.current_score))
-        self.future = []
+        self.history.append(self.current_score)
+        self.future.clear()
+        self._shared = True
+
+    def apply_edit(self, new_score):
+        """
+        Record an edited score as the new current state.
+
+        The session takes ownership of ``new_score`` without copying it, so
+        it must be a fresh object (e.g. an edited clone) that the caller no
+        longer modifies. Use ``mutate`` or ``replace_chord`` for in-place
+        edits.
+        """
+        self.current_score = new_score
+        self.save_state()
+
+    @contextmanager
+    def mutate(self):
+        """
+        Edit a copy of the current score in place and record the result.
+
+        History entries are never modified. The edited score is saved to
+        the history when the block exits normally; on error the previous
+        state is restored.
+
+        Usage:
+            with session.mutate() as score:
+                replace_chord_in_measure(score, 1, "A", "minor")
+        """
+        previous, previous_shared = self.current_score, self._shared
+        self.current_score = fast_clone_score(previous)
+        try:
+            yield self.current_score
+        except BaseException:
+            self.current_score, self._shared = previous, previous_shared
+            raise
+        self.save_state()
+
+    def replace_chord(self, measure_number, root, quality="major"):
+        """
+        Replace the chord in a measure and record it as a delta.
+
+        Only the affected measures are copied. The score itself is copied
+        at most once, when the current score is still a shared snapshot.
+        """
+        swaps = []
+        if self._shared:
+            # A fresh clone is referenced by no history entry, so it can be
+            # edited directly; undo returns to the snapshot below instead
+            self.current_score = fast_clone_score(self.current_score)
+            self._shared = False
+            score = self.current_score
+        else:
+            score = self.current_score
+            for part in score.parts:
+                measure = part.measure(measure_number)
+                if measure is not None:
+                    # Edit a fresh copy so the measure kept for undo (which an
+                    # earlier delta may also refer to) is never modified
+                    edited = deepcopy(measure)
+                    part.replace(measure, edited)
+                    swaps.append((part, measure, edited))
+
+        replace_chord_in_measure(score, measure_number, root, quality)
+
+        self.history.append(ScoreDelta(score, measure_number, swaps))
+        self.future.clear()
+
+    def clear_ghosts(self):
+        """
+        Drop all pending ghost chords.
+        """
+        self.ghosts.clear()
+
+    def accept_ghost(self, ghost: GhostChord):
+        """
+        Apply a ghost chord to the score and remove it from the ghosts.
+        """
+        self.replace_chord(ghost.measure, ghost.root, ghost.quality)
+        self.ghosts.discard(ghost)
+
+    def _restore_top(self):
+        """
+        Make the state recorded by the last history entry current.
+        """
+        top = self.history[-1]
+        if isinstance(top, ScoreDelta):
+            self.current_score = top.score
+            self._shared = False
+        else:
+            self.current_score = top
+            self._shared = True
 
     def undo(self):
         """
         Undo the last change.
+
+        Returns False (and does nothing) if there is nothing to undo.
         """
-        if len(self.history) > 1:
-            self.future.append(self.history.pop())
-            self.current_score = deepcopy(self.history[-1])
-        else:
-            print("Nothing to undo")
+        if len(self.history) <= 1:
+            return False
+        entry = self.history.pop()
+        self.future.append(entry)
+        if isinstance(entry, ScoreDelta):
+            entry.revert()
+        self._restore_top()
+        return True
 
     def redo(self):
         """
         Redo the last undone change.
+
+        Returns False (and does nothing) if there is nothing to redo.
         """
-        if self.future:
-            self.history.append(self.future.pop())
-            self.current_score = deepcopy(self.history[-1])
-        else:
-            print("Nothing to redo")
+        if not self.future:
+            return False
+        entry = self.future.pop()
+        if isinstance(entry, ScoreDelta):
+            entry.reapply()
+        self.history.append(entry)
+        self._restore_top()
+        return True
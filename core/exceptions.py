@@ -6,38 +6,100 @@ consistent error handling and meaningful error messages.
 """
 
 from typing import Optional, Any, Dict
-from core.i18n import _
+
+# core.i18n loads the translation catalogs on import; it is only needed once
+# a message is localized, so it is imported on first use
+_i18n_manager = None
+
+
+def _get_i18n():
+    global _i18n_manager
+    if _i18n_manager is None:
+        from core.i18n import get_i18n
+        _i18n_manager = get_i18n()
+    return _i18n_manager
 
 
 class ChoralWorkbenchError(Exception):
-    """Base exception for all Choral Workbench errors."""
+    """Base exception for all Choral Workbench errors.
+    
+    Subclasses set their translation key in the class statement, e.g.
+    ``class LLMTimeoutError(LLMError, translation_key="llm.timeout")``.
+    """
+    
+    # Translation key used when none is passed to the constructor
+    _translation_key = "error.general"
+    # Message template for subclasses with a fixed message; it is filled
+    # from the context only when the message is first needed
+    _template: Optional[str] = None
     
-    def __init__(self, message: str, key: Optional[str] = None, **kwargs):
+    def __init_subclass__(cls, translation_key: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if translation_key is not None:
+            cls._translation_key = translation_key
+    
+    def __init__(self, message: Optional[str] = None, key: Optional[str] = None,
+                 **kwargs):
         """Initialize the base exception.
         
         Args:
-            message: Error message
-            key: Translation key for i18n
+            message: Error message (``None`` to use the class template)
+            key: Translation key for i18n (defaults to the class key)
             **kwargs: Additional context for formatting
         """
-        super().__init__(message)
-        self.message = message
-        self.translation_key = key or "error.general"
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+        self._message = message
+        self.translation_key = key or self._translation_key
         self.context = kwargs
+        # (locale, message) of the last localization
+        self._localized: Optional[tuple[str, str]] = None
+    
+    @property
+    def message(self) -> str:
+        """Error message, formatted from the class template on first use."""
+        if self._message is None:
+            self._message = self._template.format_map(self.context)
+        return self._message
+    
+    def __str__(self) -> str:
+        return self.message
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
     
     def get_localized_message(self) -> str:
         """Get localized error message.
         
+        The message is formatted once per locale and cached, as the same
+        exception is often reported by several nested handlers.
+        
         Returns:
             Localized error message
         """
-        return _(self.translation_key, error=self.message, **self.context)
+        i18n = _get_i18n()
+        locale = i18n.current_locale
+        cached = self._localized
+        if cached is not None and cached[0] == locale:
+            return cached[1]
+        # An "error" entry in the context takes precedence over the message
+        message = i18n.get_text(self.translation_key,
+                                **{"error": self.message, **self.context})
+        self._localized = (locale, message)
+        return message
+
 
+def _detail(separator: str, value: Any) -> str:
+    """Optional message suffix, e.g. ``" - <original error>"``."""
+    return f"{separator}{value}" if value else ""
 
-class ValidationError(ChoralWorkbenchError):
+
+class ValidationError(ChoralWorkbenchError, translation_key="error.validation"):
     """Raised when input validation fails."""
     
-    def __init__(self, message: str, field: Optional[str] = None, 
+    def __init__(self, message: Optional[str], field: Optional[str] = None, 
                  value: Optional[Any] = None, **kwargs):
         """Initialize validation error.
         
@@ -47,8 +109,7 @@ class ValidationError(ChoralWorkbenchError):
             value: The invalid value
             **kwargs: Additional context
         """
-        super().__init__(message, "error.validation", 
-                        field=field, value=value, **kwargs)
+        super().__init__(message, field=field, value=value, **kwargs)
         self.field = field
         self.value = value
 
@@ -56,7 +117,7 @@ class ValidationError(ChoralWorkbenchError):
 class FileError(ChoralWorkbenchError):
     """Base class for file-related errors."""
     
-    def __init__(self, message: str, file_path: Optional[str] = None, 
+    def __init__(self, message: Optional[str], file_path: Optional[str] = None, 
                  **kwargs):
         """Initialize file error.
         
@@ -69,9 +130,11 @@ class FileError(ChoralWorkbenchError):
         self.file_path = file_path
 
 
-class FileNotFoundError(FileError):
+class FileNotFoundError(FileError, translation_key="error.file_not_found"):
     """Raised when a required file is not found."""
     
+    _template = "File not found: {path}"
+    
     def __init__(self, file_path: str, **kwargs):
         """Initialize file not found error.
         
@@ -79,14 +142,14 @@ class FileNotFoundError(FileError):
             file_path: Path to the missing file
             **kwargs: Additional context
         """
-        message = f"File not found: {file_path}"
-        super().__init__(message, file_path, "error.file_not_found", 
-                        path=file_path, **kwargs)
+        super().__init__(None, file_path, path=file_path, **kwargs)
 
 
-class InvalidFileTypeError(FileError):
+class InvalidFileTypeError(FileError, translation_key="file.invalid_type"):
     """Raised when a file has an invalid type."""
     
+    _template = "Invalid file type: {actual}. Expected: {expected_types}"
+    
     def __init__(self, file_path: str, expected_types: list[str], 
                  actual_type: Optional[str] = None, **kwargs):
         """Initialize invalid file type error.
@@ -100,15 +163,16 @@ class InvalidFileTypeError(FileError):
         self.expected_types = expected_types
         self.actual_type = actual_type
         
-        message = f"Invalid file type: {actual_type or 'unknown'}. Expected: {', '.join(expected_types)}"
-        super().__init__(message, file_path, "file.invalid_type",
-                        file_type=actual_type, expected_types=', '.join(expected_types), 
-                        **kwargs)
+        super().__init__(None, file_path, file_type=actual_type,
+                        actual=actual_type or "unknown",
+                        expected_types=", ".join(expected_types), **kwargs)
 
 
-class FileSizeError(FileError):
+class FileSizeError(FileError, translation_key="file.too_large"):
     """Raised when a file is too large."""
     
+    _template = "File too large: {file_size} bytes (max: {max_bytes} bytes)"
+    
     def __init__(self, file_path: str, file_size: int, max_size: int, **kwargs):
         """Initialize file size error.
         
@@ -121,16 +185,17 @@ class FileSizeError(FileError):
         self.file_size = file_size
         self.max_size = max_size
         
-        message = f"File too large: {file_size} bytes (max: {max_size} bytes)"
-        super().__init__(message, file_path, "file.too_large",
-                        max_size=max_size / (1024*1024), **kwargs)
+        # max_size is given in MB for the translation
+        super().__init__(None, file_path, file_size=file_size,
+                        max_bytes=max_size, max_size=max_size / (1024*1024),
+                        **kwargs)
 
 
 class ScoreError(ChoralWorkbenchError):
     """Base class for score-related errors."""
     
-    def __init__(self, message: str, score_info: Optional[Dict[str, Any]] = None, 
-                 **kwargs):
+    def __init__(self, message: Optional[str],
+                 score_info: Optional[Dict[str, Any]] = None, **kwargs):
         """Initialize score error.
         
         Args:
@@ -142,9 +207,11 @@ class ScoreError(ChoralWorkbenchError):
         self.score_info = score_info or {}
 
 
-class ScoreParsingError(ScoreError):
+class ScoreParsingError(ScoreError, translation_key="score.parse_failed"):
     """Raised when MusicXML score parsing fails."""
     
+    _template = "Failed to parse MusicXML score: {file_path}{detail}"
+    
     def __init__(self, file_path: str, parse_error: Optional[Exception] = None, 
                  **kwargs):
         """Initialize score parsing error.
@@ -156,12 +223,9 @@ class ScoreParsingError(ScoreError):
         """
         self.parse_error = parse_error
         
-        message = f"Failed to parse MusicXML score: {file_path}"
-        if parse_error:
-            message += f" - {str(parse_error)}"
-        
-        super().__init__(message, {"file_path": file_path}, 
-                        "score.parse_failed", error=str(parse_error) if parse_error else "", 
+        super().__init__(None, {"file_path": file_path}, file_path=file_path,
+                        detail=_detail(" - ", parse_error),
+                        error=str(parse_error) if parse_error else "",
                         **kwargs)
 
 
@@ -200,8 +264,8 @@ class VoiceDetectionError(ScoreError):
 class AudioError(ChoralWorkbenchError):
     """Base class for audio-related errors."""
     
-    def __init__(self, message: str, audio_info: Optional[Dict[str, Any]] = None, 
-                 **kwargs):
+    def __init__(self, message: Optional[str],
+                 audio_info: Optional[Dict[str, Any]] = None, **kwargs):
         """Initialize audio error.
         
         Args:
@@ -213,7 +277,7 @@ class AudioError(ChoralWorkbenchError):
         self.audio_info = audio_info or {}
 
 
-class AudioRenderingError(AudioError):
+class AudioRenderingError(AudioError, translation_key="audio.render_failed"):
     """Raised when audio rendering fails."""
     
     def __init__(self, message: str, render_step: Optional[str] = None, 
@@ -226,13 +290,14 @@ class AudioRenderingError(AudioError):
             **kwargs: Additional context
         """
         self.render_step = render_step
-        super().__init__(message, {"render_step": render_step}, 
-                        "audio.render_failed", error=message, **kwargs)
+        super().__init__(message, {"render_step": render_step}, **kwargs)
 
 
-class SoundFontNotFoundError(AudioError):
+class SoundFontNotFoundError(AudioError, translation_key="audio.no_soundfont"):
     """Raised when SoundFont file is not found."""
     
+    _template = "SoundFont not found: {soundfont_path}"
+    
     def __init__(self, soundfont_path: str, **kwargs):
         """Initialize SoundFont not found error.
         
@@ -242,14 +307,16 @@ class SoundFontNotFoundError(AudioError):
         """
         self.soundfont_path = soundfont_path
         
-        message = f"SoundFont not found: {soundfont_path}"
-        super().__init__(message, {"soundfont_path": soundfont_path}, 
-                        "audio.no_soundfont", **kwargs)
+        super().__init__(None, {"soundfont_path": soundfont_path},
+                        soundfont_path=soundfont_path, **kwargs)
 
 
-class InvalidTuningError(ValidationError):
+class InvalidTuningError(ValidationError, translation_key="error.invalid_tuning"):
     """Raised when tuning frequency is invalid."""
     
+    _template = ("Invalid tuning frequency: {tuning} Hz. "
+                 "Must be between {min} and {max} Hz")
+    
     def __init__(self, tuning: float, min_tuning: float, max_tuning: float, 
                  **kwargs):
         """Initialize invalid tuning error.
@@ -264,17 +331,15 @@ class InvalidTuningError(ValidationError):
         self.min_tuning = min_tuning
         self.max_tuning = max_tuning
         
-        message = f"Invalid tuning frequency: {tuning} Hz. Must be between {min_tuning} and {max_tuning} Hz"
-        super().__init__(message, "tuning", tuning, 
-                        "error.invalid_tuning", tuning=tuning, min=min_tuning, 
-                        max=max_tuning, **kwargs)
+        super().__init__(None, "tuning", tuning, tuning=tuning,
+                        min=min_tuning, max=max_tuning, **kwargs)
 
 
 class LLMError(ChoralWorkbenchError):
     """Base class for LLM-related errors."""
     
-    def __init__(self, message: str, llm_info: Optional[Dict[str, Any]] = None, 
-                 **kwargs):
+    def __init__(self, message: Optional[str],
+                 llm_info: Optional[Dict[str, Any]] = None, **kwargs):
         """Initialize LLM error.
         
         Args:
@@ -286,9 +351,11 @@ class LLMError(ChoralWorkbenchError):
         self.llm_info = llm_info or {}
 
 
-class LLMConnectionError(LLMError):
+class LLMConnectionError(LLMError, translation_key="llm.no_connection"):
     """Raised when connection to LLM service fails."""
     
+    _template = "Failed to connect to LLM service: {service_url}{detail}"
+    
     def __init__(self, service_url: str, connection_error: Optional[Exception] = None, 
                  **kwargs):
         """Initialize LLM connection error.
@@ -301,17 +368,16 @@ class LLMConnectionError(LLMError):
         self.service_url = service_url
         self.connection_error = connection_error
         
-        message = f"Failed to connect to LLM service: {service_url}"
-        if connection_error:
-            message += f" - {str(connection_error)}"
-        
-        super().__init__(message, {"service_url": service_url}, 
-                        "llm.no_connection", **kwargs)
+        super().__init__(None, {"service_url": service_url},
+                        service_url=service_url,
+                        detail=_detail(" - ", connection_error), **kwargs)
 
 
-class LLMTimeoutError(LLMError):
+class LLMTimeoutError(LLMError, translation_key="llm.timeout"):
     """Raised when LLM request times out."""
     
+    _template = "LLM request timed out after {timeout} seconds"
+    
     def __init__(self, timeout_seconds: int, **kwargs):
         """Initialize LLM timeout error.
         
@@ -321,14 +387,15 @@ class LLMTimeoutError(LLMError):
         """
         self.timeout_seconds = timeout_seconds
         
-        message = f"LLM request timed out after {timeout_seconds} seconds"
-        super().__init__(message, {"timeout": timeout_seconds}, 
-                        "llm.timeout", **kwargs)
+        super().__init__(None, {"timeout": timeout_seconds},
+                        timeout=timeout_seconds, **kwargs)
 
 
-class LLMGenerationError(LLMError):
+class LLMGenerationError(LLMError, translation_key="llm.generation_failed"):
     """Raised when LLM text generation fails."""
     
+    _template = "LLM text generation failed{detail}"
+    
     def __init__(self, prompt: str, generation_error: Optional[Exception] = None, 
                  **kwargs):
         """Initialize LLM generation error.
@@ -341,19 +408,16 @@ class LLMGenerationError(LLMError):
         self.prompt = prompt
         self.generation_error = generation_error
         
-        message = "LLM text generation failed"
-        if generation_error:
-            message += f": {str(generation_error)}"
-        
-        super().__init__(message, {"prompt": prompt}, 
-                        "llm.generation_failed", error=str(generation_error) if generation_error else "", 
+        super().__init__(None, {"prompt": prompt},
+                        detail=_detail(": ", generation_error),
+                        error=str(generation_error) if generation_error else "",
                         **kwargs)
 
 
 class SessionError(ChoralWorkbenchError):
     """Base class for session-related errors."""
     
-    def __init__(self, message: str, session_id: Optional[str] = None, 
+    def __init__(self, message: Optional[str], session_id: Optional[str] = None, 
                  **kwargs):
         """Initialize session error.
         
@@ -362,13 +426,15 @@ class SessionError(ChoralWorkbenchError):
             session_id: ID of the problematic session
             **kwargs: Additional context
         """
-        super().__init__(message, **kwargs)
+        super().__init__(message, session_id=session_id, **kwargs)
         self.session_id = session_id
 
 
-class SessionNotFoundError(SessionError):
+class SessionNotFoundError(SessionError, translation_key="session.not_found"):
     """Raised when a session is not found."""
     
+    _template = "Session not found: {session_id}"
+    
     def __init__(self, session_id: str, **kwargs):
         """Initialize session not found error.
         
@@ -376,14 +442,14 @@ class SessionNotFoundError(SessionError):
             session_id: ID of the missing session
             **kwargs: Additional context
         """
-        message = f"Session not found: {session_id}"
-        super().__init__(message, session_id, "session.not_found", 
-                        session_id=session_id, **kwargs)
+        super().__init__(None, session_id, **kwargs)
 
 
-class SessionCorruptedError(SessionError):
+class SessionCorruptedError(SessionError, translation_key="session.corrupted"):
     """Raised when a session file is corrupted."""
     
+    _template = "Session corrupted: {session_id}{detail}"
+    
     def __init__(self, session_id: str, corruption_details: Optional[str] = None, 
                  **kwargs):
         """Initialize session corrupted error.
@@ -395,11 +461,8 @@ class SessionCorruptedError(SessionError):
         """
         self.corruption_details = corruption_details
         
-        message = f"Session corrupted: {session_id}"
-        if corruption_details:
-            message += f" - {corruption_details}"
-        
-        super().__init__(message, session_id, "session.corrupted", **kwargs)
+        super().__init__(None, session_id,
+                        detail=_detail(" - ", corruption_details), **kwargs)
 
 
 class ConfigurationError(ChoralWorkbenchError):
@@ -420,7 +483,7 @@ class ConfigurationError(ChoralWorkbenchError):
         super().__init__(message, **kwargs)
 
 
-class NetworkError(ChoralWorkbenchError):
+class NetworkError(ChoralWorkbenchError, translation_key="error.network"):
     """Base class for network-related errors."""
     
     def __init__(self, message: str, url: Optional[str] = None, 
@@ -433,15 +496,16 @@ class NetworkError(ChoralWorkbenchError):
             status_code: HTTP status code
             **kwargs: Additional context
         """
-        super().__init__(message, "error.network", url=url, 
-                        status_code=status_code, **kwargs)
+        super().__init__(message, url=url, status_code=status_code, **kwargs)
         self.url = url
         self.status_code = status_code
 
 
-class PermissionError(ChoralWorkbenchError):
+class PermissionError(ChoralWorkbenchError, translation_key="error.permission"):
     """Raised when permission is denied for an operation."""
     
+    _template = "Permission denied: {operation}{detail}"
+    
     def __init__(self, operation: str, resource: Optional[str] = None, **kwargs):
         """Initialize permission error.
         
@@ -453,8 +517,5 @@ class PermissionError(ChoralWorkbenchError):
         self.operation = operation
         self.resource = resource
         
-        message = f"Permission denied: {operation}"
-        if resource:
-            message += f" on {resource}"
-        
-        super().__init__(message, "error.permission", error=message, **kwargs)
\ No newline at end of file
+        super().__init__(None, operation=operation,
+                        detail=_detail(" on ", resource), **kwargs)
@@ -7,10 +7,37 @@ to make the application accessible in multiple languages.
 
 import gettext
 import json
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Any
 from core.constants import PathDefaults, APP_NAME
 
+# Name of the JSON fallback file inside each locale directory
+FALLBACK_FILE_NAME = "fallback.json"
+# Former single fallback file for all locales, still read if present
+LEGACY_FALLBACK_FILE_NAME = "fallback_translations.json"
+
+# Number formatting per locale; other locales use the English format
+_NUMBER_FORMATTERS = {
+    "en": lambda number: f"{number:.2f}",
+    "de": lambda number: f"{number:.2f}".replace(".", ","),
+}
+
+
+class _FormatArgs(dict):
+    """Formatting parameters; placeholders without a value become empty."""
+    
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+@lru_cache(maxsize=256)
+def _format_quantity(number: float, locale: str, unit: str) -> str:
+    """Format a number with a unit; tunings and tempi repeat a lot."""
+    formatter = _NUMBER_FORMATTERS.get(locale, _NUMBER_FORMATTERS["en"])
+    return f"{formatter(number)} {unit}"
+
 
 class I18nManager:
     """Manages internationalization and localization for the application."""
@@ -26,40 +53,111 @@ class I18nManager:
         self.locale_dir = Path(locale_dir)
         self.default_locale = default_locale
         self.current_locale = default_locale
-        self.translations: Dict[str, gettext.GNUTranslations] = {}
+        # Loaded on first use; None marks a locale without a catalog
+        self.translations: Dict[str, Optional[gettext.GNUTranslations]] = {}
+        self._available_locales: set[str] = set()
+        # Per-locale JSON fallback strings, loaded on first use
         self.fallback_translations: Dict[str, Dict[str, str]] = {}
+        # Contents of the legacy fallback file; None until it has been read
+        self._legacy_fallback: Optional[Dict[str, Dict[str, str]]] = None
+        # Resolved (unformatted) text per (locale, key), together with
+        # whether it has placeholders at all
+        self._cache: Dict[tuple, tuple] = {}
         
-        # Load translations
+        # Discover available locales
         self._load_translations()
-        self._load_fallback_translations()
     
     def _load_translations(self) -> None:
-        """Load gettext translation files."""
+        """Discover locale directories; catalogs are loaded on first use."""
         if not self.locale_dir.exists():
             return
         
-        for locale_dir in self.locale_dir.iterdir():
-            if locale_dir.is_dir():
-                try:
-                    translation = gettext.translation(
-                        APP_NAME.lower().replace(" ", "_"),
-                        localedir=self.locale_dir,
-                        languages=[locale_dir.name]
-                    )
-                    self.translations[locale_dir.name] = translation
-                except FileNotFoundError:
-                    # No translation file found for this locale
-                    continue
+        self._available_locales = {
+            entry.name for entry in self.locale_dir.iterdir() if entry.is_dir()
+        }
     
-    def _load_fallback_translations(self) -> None:
-        """Load JSON fallback translations for development."""
-        fallback_file = self.locale_dir / "fallback_translations.json"
-        if fallback_file.exists():
+    def _get_translation(self, locale: str) -> Optional[gettext.GNUTranslations]:
+        """Get the gettext catalog of a locale, loading it on first use.
+        
+        Args:
+            locale: Language locale
+            
+        Returns:
+            The catalog, or None if the locale has none
+        """
+        try:
+            return self.translations[locale]
+        except KeyError:
+            pass
+        
+        translation = None
+        if locale in self._available_locales:
             try:
-                with open(fallback_file, 'r', encoding='utf-8') as f:
-                    self.fallback_translations = json.load(f)
+                translation = gettext.translation(
+                    APP_NAME.lower().replace(" ", "_"),
+                    localedir=self.locale_dir,
+                    languages=[locale]
+                )
+            except FileNotFoundError:
+                # No translation file found for this locale
+                pass
+        self.translations[locale] = translation
+        return translation
+    
+    def _get_fallback(self, locale: str) -> Dict[str, str]:
+        """Get the JSON fallback translations of a locale, loading them on first use.
+        
+        Args:
+            locale: Language locale
+            
+        Returns:
+            Mapping of keys to texts (empty if the locale has none)
+        """
+        try:
+            return self.fallback_translations[locale]
+        except KeyError:
+            pass
+        
+        _ensure_template()
+        translations: Dict[str, str] = {}
+        fallback_file = self.locale_dir / locale / FALLBACK_FILE_NAME
+        try:
+            with open(fallback_file, 'r', encoding='utf-8') as f:
+                translations = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            pass
+        # Customizations in the legacy file take precedence
+        legacy_translations = self._get_legacy_fallback().get(locale)
+        if legacy_translations:
+            translations = {**translations, **legacy_translations}
+        self.fallback_translations[locale] = translations
+        return translations
+    
+    def _get_legacy_fallback(self) -> Dict[str, Dict[str, str]]:
+        """Get the legacy all-locale fallback file, reading it at most once.
+        
+        Returns:
+            Mapping of locales to their translations (empty if there is no
+            legacy file)
+        """
+        if self._legacy_fallback is not None:
+            return self._legacy_fallback
+        
+        self._legacy_fallback = {}
+        legacy_file = self.locale_dir / LEGACY_FALLBACK_FILE_NAME
+        if legacy_file.exists():
+            try:
+                with open(legacy_file, 'r', encoding='utf-8') as f:
+                    self._legacy_fallback = json.load(f)
             except (json.JSONDecodeError, IOError):
                 pass
+            warnings.warn(
+                f"{legacy_file} is deprecated; move its translations to "
+                f"<locale>/{FALLBACK_FILE_NAME} files.",
+                DeprecationWarning,
+                stacklevel=3
+            )
+        return self._legacy_fallback
     
     def set_locale(self, locale: str) -> None:
         """Set the current locale.
@@ -67,15 +165,20 @@ class I18nManager:
         Args:
             locale: Language locale (e.g., "en", "de")
         """
-        if locale in self.translations or locale in self.fallback_translations:
+        if self._get_fallback(locale) or self._get_translation(locale) is not None:
             self.current_locale = locale
         else:
             # Fallback to default locale
             self.current_locale = self.default_locale
+        self._cache.clear()
     
     def get_text(self, key: str, **kwargs) -> str:
         """Get translated text for the given key.
         
+        The text for each key is looked up once per locale and cached;
+        repeated calls only format it, and only if it has placeholders.
+        Placeholders without a matching parameter are left empty.
+        
         Args:
             key: Translation key (e.g., "ui.musicxml_input")
             **kwargs: Formatting parameters
@@ -83,32 +186,47 @@ class I18nManager:
         Returns:
             Translated text string
         """
+        cache_key = (self.current_locale, key)
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            text = self._lookup(key)
+            entry = self._cache[cache_key] = (text, "{" in text)
+        text, needs_format = entry
+        return text.format_map(_FormatArgs(kwargs)) if needs_format else text
+    
+    def _lookup(self, key: str) -> str:
+        """Resolve the unformatted text for a key in the current locale.
+        
+        Args:
+            key: Translation key
+            
+        Returns:
+            Text from gettext, the fallback translations of the current or
+            default locale, or the key itself
+        """
         # Try gettext first
-        if self.current_locale in self.translations:
-            translation = self.translations[self.current_locale]
-            translation.install()
+        translation = self._get_translation(self.current_locale)
+        if translation is not None:
             try:
                 # Use gettext translation
                 translated = translation.gettext(key)
                 if translated != key:  # Translation found
-                    return translated.format(**kwargs) if kwargs else translated
+                    return translated
             except Exception:
                 pass
         
         # Try fallback translations
-        if self.current_locale in self.fallback_translations:
-            locale_translations = self.fallback_translations[self.current_locale]
-            if key in locale_translations:
-                return locale_translations[key].format(**kwargs) if kwargs else locale_translations[key]
+        locale_translations = self._get_fallback(self.current_locale)
+        if key in locale_translations:
+            return locale_translations[key]
         
         # Try default locale
-        if self.default_locale in self.fallback_translations:
-            default_translations = self.fallback_translations[self.default_locale]
-            if key in default_translations:
-                return default_translations[key].format(**kwargs) if kwargs else default_translations[key]
+        default_translations = self._get_fallback(self.default_locale)
+        if key in default_translations:
+            return default_translations[key]
         
         # Return key as last resort
-        return key.format(**kwargs) if kwargs else key
+        return key
     
     def get_available_locales(self) -> list[str]:
         """Get list of available locales.
@@ -116,9 +234,12 @@ class I18nManager:
         Returns:
             List of available locale codes
         """
-        locales = set(self.translations.keys())
-        locales.update(self.fallback_translations.keys())
-        return sorted(list(locales))
+        # Locale directories (rescanned, as the template may have been
+        # written since construction) plus locales of the legacy file
+        _ensure_template()
+        self._load_translations()
+        locales = self._available_locales | set(self._get_legacy_fallback())
+        return sorted(locales)
     
     def format_number(self, number: float, locale: Optional[str] = None) -> str:
         """Format number according to locale conventions.
@@ -131,12 +252,8 @@ class I18nManager:
             Formatted number string
         """
         target_locale = locale or self.current_locale
-        
-        # Simple locale-based formatting
-        if target_locale == "de":
-            return f"{number:.2f}".replace(".", ",")
-        else:
-            return f"{number:.2f}"
+        formatter = _NUMBER_FORMATTERS.get(target_locale, _NUMBER_FORMATTERS["en"])
+        return formatter(number)
     
     def format_frequency(self, frequency: float, locale: Optional[str] = None) -> str:
         """Format frequency with appropriate units.
@@ -148,8 +265,7 @@ class I18nManager:
         Returns:
             Formatted frequency string
         """
-        formatted = self.format_number(frequency, locale)
-        return f"{formatted} Hz"
+        return _format_quantity(frequency, locale or self.current_locale, "Hz")
     
     def format_tempo(self, tempo: float, locale: Optional[str] = None) -> str:
         """Format tempo with appropriate units.
@@ -161,8 +277,7 @@ class I18nManager:
         Returns:
             Formatted tempo string
         """
-        formatted = self.format_number(tempo, locale)
-        return f"{formatted} BPM"
+        return _format_quantity(tempo, locale or self.current_locale, "BPM")
 
 
 # Global i18n instance
@@ -200,113 +315,118 @@ def _(key: str, **kwargs) -> str:
     return _i18n_manager.get_text(key, **kwargs)
 
 
+# All translatable strings with their default English text
+_TEMPLATE: Dict[str, str] = {
+    # UI Elements
+    "ui.musicxml_input": "MusicXML Input",
+    "ui.llm_prompt": "LLM Prompt",
+    "ui.base_tuning": "Base Tuning (Hz)",
+    "ui.render_audio": "Render Audio",
+    "ui.download_score": "Download Score",
+    "ui.soprano_prompt": "Soprano Prompt",
+    "ui.alto_prompt": "Alto Prompt", 
+    "ui.tenor_prompt": "Tenor Prompt",
+    "ui.bass_prompt": "Bass Prompt",
+    "ui.harmonize": "Harmonize",
+    "ui.ghost_chords": "Ghost Chords",
+    "ui.accept": "Accept",
+    "ui.reject": "Reject",
+    "ui.undo": "Undo",
+    "ui.redo": "Redo",
+    "ui.save_session": "Save Session",
+    "ui.load_session": "Load Session",
+    
+    # File operations
+    "file.upload_success": "File uploaded successfully: {filename}",
+    "file.upload_failed": "Failed to upload file: {error}",
+    "file.invalid_type": "Invalid file type. Please upload a MusicXML file.",
+    "file.too_large": "File too large. Maximum size is {max_size} MB.",
+    
+    # Audio operations
+    "audio.rendering": "Rendering audio...",
+    "audio.render_success": "Audio rendered successfully",
+    "audio.render_failed": "Failed to render audio: {error}",
+    "audio.no_soundfont": "SoundFont not found. Please check audio configuration.",
+    
+    # LLM operations
+    "llm.generating": "Generating harmonization...",
+    "llm.generation_success": "Harmonization generated successfully",
+    "llm.generation_failed": "Failed to generate harmonization: {error}",
+    "llm.no_connection": "No connection to LLM service",
+    "llm.timeout": "LLM request timed out",
+    
+    # Session operations
+    "session.created": "Session created: {session_id}",
+    "session.loaded": "Session loaded successfully",
+    "session.saved": "Session saved successfully",
+    "session.not_found": "Session not found: {session_id}",
+    "session.corrupted": "Session file is corrupted",
+    
+    # Score operations
+    "score.parsing": "Parsing MusicXML score...",
+    "score.parsed": "Score parsed successfully",
+    "score.parse_failed": "Failed to parse score: {error}",
+    "score.no_voices": "No voices detected in score",
+    "score.invalid_harmony": "Invalid harmony detected",
+    
+    # Voice information
+    "voice.soprano": "Soprano",
+    "voice.alto": "Alto",
+    "voice.tenor": "Tenor", 
+    "voice.bass": "Bass",
+    "voice.unknown": "Unknown Voice",
+    
+    # Error messages
+    "error.general": "An error occurred: {error}",
+    "error.validation": "Validation error: {error}",
+    "error.network": "Network error: {error}",
+    "error.file_not_found": "File not found: {path}",
+    "error.permission": "Permission denied: {error}",
+    
+    # Success messages
+    "success.changes_applied": "Changes applied successfully",
+    "success.file_saved": "File saved successfully: {filename}",
+    "success.audio_exported": "Audio exported successfully: {filename}",
+    
+    # Help text
+    "help.musicxml_format": "Upload a MusicXML file (.xml or .mxl) containing SATB voices",
+    "help.llm_prompt": "Enter a prompt for the LLM to generate harmonization",
+    "help.base_tuning": "Select the base tuning frequency for audio rendering",
+    "help.voice_prompt": "Enter a specific prompt for this voice part",
+}
+
+
 def create_translation_template() -> Dict[str, str]:
     """Create a template with all translatable strings.
     
     Returns:
-        Dictionary with translation keys and default English text
+        New dictionary with translation keys and default English text
     """
-    return {
-        # UI Elements
-        "ui.musicxml_input": "MusicXML Input",
-        "ui.llm_prompt": "LLM Prompt",
-        "ui.base_tuning": "Base Tuning (Hz)",
-        "ui.render_audio": "Render Audio",
-        "ui.download_score": "Download Score",
-        "ui.soprano_prompt": "Soprano Prompt",
-        "ui.alto_prompt": "Alto Prompt", 
-        "ui.tenor_prompt": "Tenor Prompt",
-        "ui.bass_prompt": "Bass Prompt",
-        "ui.harmonize": "Harmonize",
-        "ui.ghost_chords": "Ghost Chords",
-        "ui.accept": "Accept",
-        "ui.reject": "Reject",
-        "ui.undo": "Undo",
-        "ui.redo": "Redo",
-        "ui.save_session": "Save Session",
-        "ui.load_session": "Load Session",
-        
-        # File operations
-        "file.upload_success": "File uploaded successfully: {filename}",
-        "file.upload_failed": "Failed to upload file: {error}",
-        "file.invalid_type": "Invalid file type. Please upload a MusicXML file.",
-        "file.too_large": "File too large. Maximum size is {max_size} MB.",
-        
-        # Audio operations
-        "audio.rendering": "Rendering audio...",
-        "audio.render_success": "Audio rendered successfully",
-        "audio.render_failed": "Failed to render audio: {error}",
-        "audio.no_soundfont": "SoundFont not found. Please check audio configuration.",
-        
-        # LLM operations
-        "llm.generating": "Generating harmonization...",
-        "llm.generation_success": "Harmonization generated successfully",
-        "llm.generation_failed": "Failed to generate harmonization: {error}",
-        "llm.no_connection": "No connection to LLM service",
-        "llm.timeout": "LLM request timed out",
-        
-        # Session operations
-        "session.created": "Session created: {session_id}",
-        "session.loaded": "Session loaded successfully",
-        "session.saved": "Session saved successfully",
-        "session.not_found": "Session not found: {session_id}",
-        "session.corrupted": "Session file is corrupted",
-        
-        # Score operations
-        "score.parsing": "Parsing MusicXML score...",
-        "score.parsed": "Score parsed successfully",
-        "score.parse_failed": "Failed to parse score: {error}",
-        "score.no_voices": "No voices detected in score",
-        "score.invalid_harmony": "Invalid harmony detected",
-        
-        # Voice information
-        "voice.soprano": "Soprano",
-        "voice.alto": "Alto",
-        "voice.tenor": "Tenor", 
-        "voice.bass": "Bass",
-        "voice.unknown": "Unknown Voice",
-        
-        # Error messages
-        "error.general": "An error occurred: {error}",
-        "error.validation": "Validation error: {error}",
-        "error.network": "Network error: {error}",
-        "error.file_not_found": "File not found: {path}",
-        "error.permission": "Permission denied: {error}",
-        
-        # Success messages
-        "success.changes_applied": "Changes applied successfully",
-        "success.file_saved": "File saved successfully: {filename}",
-        "success.audio_exported": "Audio exported successfully: {filename}",
-        
-        # Help text
-        "help.musicxml_format": "Upload a MusicXML file (.xml or .mxl) containing SATB voices",
-        "help.llm_prompt": "Enter a prompt for the LLM to generate harmonization",
-        "help.base_tuning": "Select the base tuning frequency for audio rendering",
-        "help.voice_prompt": "Enter a specific prompt for this voice part",
-    }
+    return dict(_TEMPLATE)
 
 
 def save_translation_template() -> None:
-    """Save the translation template to the fallback translations file."""
-    template = create_translation_template()
-    
-    # Ensure locales directory exists
-    PathDefaults.LOCALES_DIR.mkdir(exist_ok=True)
+    """Save the translation template as per-locale fallback files."""
+    # German starts out as a copy of the English text
+    fallback_data = {"en": _TEMPLATE, "de": _TEMPLATE}
     
-    # Save as fallback translations
-    fallback_file = PathDefaults.LOCALES_DIR / "fallback_translations.json"
-    fallback_data = {
-        "en": template,
-        "de": {key: value for key, value in template.items()}  # Copy English as base
-    }
-    
-    try:
-        with open(fallback_file, 'w', encoding='utf-8') as f:
-            json.dump(fallback_data, f, indent=2, ensure_ascii=False)
-    except IOError as e:
-        print(f"Failed to save translation template: {e}")
+    # One file per locale, so only the active locales are ever parsed
+    for locale, translations in fallback_data.items():
+        locale_dir = PathDefaults.LOCALES_DIR / locale
+        try:
+            locale_dir.mkdir(parents=True, exist_ok=True)
+            with open(locale_dir / FALLBACK_FILE_NAME, 'w', encoding='utf-8') as f:
+                json.dump(translations, f, indent=2, ensure_ascii=False)
+        except IOError as e:
+            print(f"Failed to save translation template: {e}")
 
 
-# Auto-save translation template if it doesn't exist
-if not (PathDefaults.LOCALES_DIR / "fallback_translations.json").exists():
-    save_translation_template()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def _ensure_template() -> None:
+    """Save the translation template if it doesn't exist yet.
+    
+    Runs on the first fallback lookup instead of at import, and only once
+    per process.
+    """
+    if not (PathDefaults.LOCALES_DIR / "en" / FALLBACK_FILE_NAME).exists():
+        save_translation_template()
\ No newline at end of file
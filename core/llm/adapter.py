@@ -1,6 +1,8 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
-from core.llm.llm_wrapper import OllamaLLM
+from core.llm.llm_wrapper import FALLBACK_CHORD, OllamaLLM
 
 
 class LLMAdapter:
@@ -19,6 +21,10 @@ class LLMAdapter:
     def harmonize_multi_voice(self, prompts: Dict[str, str]) -> Dict[str, Dict]:
         """Harmonize multiple voices given per-voice prompts.
 
+        The voices are requested concurrently on a small thread pool, so
+        the total wait is that of the slowest voice. Async callers can use
+        :meth:`harmonize_multi_voice_async` instead.
+
         Args:
             prompts: Mapping from voice key (e.g. 'S', 'A', 'T', 'B') to prompt text.
 
@@ -28,14 +34,36 @@ class LLMAdapter:
                 - root (str)
                 - quality (str)
         """
-        results: Dict[str, Dict] = {}
-        for voice, prompt in prompts.items():
-            try:
-                # Let the underlying LLM produce a chord for this voice
-                data = self.llm.harmonize_prompt(f"{prompt} (voice: {voice})")
-            except Exception as e:
-                # Fallback to a safe default to keep the workflow running
-                print(f"[LLMAdapter] Harmonization failed for {voice}: {e}")
-                data = {"measure": 1, "root": "C", "quality": "major"}
-            results[voice] = data
-        return results
+        if not prompts:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            futures = {
+                voice: executor.submit(self._harmonize_one, voice, prompt)
+                for voice, prompt in prompts.items()
+            }
+            return {voice: future.result() for voice, future in futures.items()}
+
+    async def harmonize_multi_voice_async(self, prompts: Dict[str, str]) -> Dict[str, Dict]:
+        """Harmonize multiple voices concurrently.
+
+        Each voice is a blocking call to the local model, so the calls run
+        in the default executor and the total wait is that of the slowest
+        voice instead of the sum over all voices.
+        """
+        loop = asyncio.get_running_loop()
+        voices = list(prompts)
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, self._harmonize_one, voice, prompts[voice])
+            for voice in voices
+        ))
+        return dict(zip(voices, results))
+
+    def _harmonize_one(self, voice: str, prompt: str) -> Dict:
+        """Harmonize a single voice, falling back to a default chord on error."""
+        try:
+            # Let the underlying LLM produce a chord for this voice
+            return self.llm.harmonize_prompt(f"{prompt} (voice: {voice})")
+        except Exception as e:
+            # Fallback to a safe default to keep the workflow running
+            print(f"[LLMAdapter] Harmonization failed for {voice}: {e}")
+            return FALLBACK_CHORD.copy()
@@ -1,15 +1,27 @@
+import re
+
 from core.editor.ghost import GhostChord
 
+# Stichwort -> vorgeschlagene Akkorde als (measure, root, quality)
+_RULES = {
+    "romantic": ((1, "A", "minor"), (2, "F", "major")),
+}
+
+# Ein Durchlauf über den Prompt für alle Stichwörter
+_RULE_RE = re.compile("|".join(map(re.escape, _RULES)), re.IGNORECASE)
+
 
 def generate_ghost_chords(prompt: str):
     """
     Platzhalter für LLM-Ausgabe.
     Später: Parsing echter LLM-Antworten.
     """
-    ghosts = []
-
-    if "romantic" in prompt.lower():
-        ghosts.append(GhostChord(measure=1, root="Am"))
-        ghosts.append(GhostChord(measure=2, root="F"))
+    # Jede Regel höchstens einmal, in der Reihenfolge im Prompt
+    keywords = dict.fromkeys(m.group(0).lower() for m in _RULE_RE.finditer(prompt))
 
-    return ghosts
+    # Neue GhostChord-Objekte pro Aufruf: GhostLayer unterscheidet sie per id()
+    return [
+        GhostChord(measure, root, quality)
+        for keyword in keywords
+        for measure, root, quality in _RULES[keyword]
+    ]
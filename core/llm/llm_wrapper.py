@@ -3,23 +3,40 @@
 import json
 import subprocess
 
+from core.constants import LLMDefaults
+
+try:
+    import requests
+except ImportError:  # requests ist optional; ohne wird die Ollama-CLI verwendet
+    requests = None
+
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+
+# Ersatz-Akkord, wenn das LLM keine verwertbare Antwort liefert
+# (nur lesen; Aufrufer erhalten eine Kopie)
+FALLBACK_CHORD = {"measure": 1, "root": "C", "quality": "major"}
+
 class BaseLLM:
     """Basisklasse für beliebige LLMs"""
     def harmonize_prompt(self, prompt_text):
         raise NotImplementedError()
 
 class DummyLLM(BaseLLM):
+    # Gültige Grundtöne, einmal pro Klasse statt pro Aufruf angelegt
+    _ROOTS = frozenset("CDEFGAB")
+
     def harmonize_prompt(self, prompt_text):
-        root_map = {"C":"C", "D":"D", "E":"E", "F":"F", "G":"G", "A":"A", "B":"B"}
         root = prompt_text[0].upper()
-        if root not in root_map:
+        if root not in self._ROOTS:
             root = "C"
         return {"measure": 1, "root": root, "quality": "major"}
 
 class OllamaLLM(BaseLLM):
-    """LLM-Anbindung via Ollama CLI"""
+    """LLM-Anbindung via Ollama HTTP-API (Fallback: Ollama CLI)"""
     def __init__(self, model_name="mistral-7b"):
         self.model_name = model_name
+        # Langlebige Session: hält die Verbindung zum Ollama-Server offen
+        self._session = requests.Session() if requests is not None else None
 
     def harmonize_prompt(self, prompt_text):
         """
@@ -27,18 +44,37 @@ class OllamaLLM(BaseLLM):
         Erwartete Antwort: JSON {"measure": int, "root": "C", "quality": "major"}
         """
         try:
-            # Ollama CLI-Aufruf
+            if self._session is not None:
+                return self._generate_http(prompt_text)
+            # Ollama CLI-Aufruf; liest den Prompt bis EOF, daher ein Prozess pro Prompt
             result = subprocess.run(
-                ["ollama", "eval", self.model_name, "--json", prompt_text],
+                ["ollama", "run", self.model_name, "--format", "json",
+                 "--keepalive", LLMDefaults.KEEP_ALIVE, prompt_text],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                timeout=LLMDefaults.TIMEOUT,
             )
-            # Ollama liefert JSON aus
-            response_json = result.stdout.strip()
-            response = json.loads(response_json)
-            return response
+            # Die Modellantwort ist JSON
+            return json.loads(result.stdout)
         except Exception as e:
             print(f"[LLM ERROR] {e}")
             # Fallback auf Dummy
-            return {"measure": 1, "root": "C", "quality": "major"}
+            return FALLBACK_CHORD.copy()
+
+    def _generate_http(self, prompt_text):
+        """Ein Prompt über /api/generate; die Modellantwort ist selbst JSON."""
+        response = self._session.post(
+            OLLAMA_GENERATE_URL,
+            json={
+                "model": self.model_name,
+                "prompt": prompt_text,
+                "format": "json",
+                "stream": False,
+                # Modell zwischen den Prompts geladen lassen
+                "keep_alive": LLMDefaults.KEEP_ALIVE,
+            },
+            timeout=LLMDefaults.TIMEOUT,
+        )
+        response.raise_for_status()
+        return json.loads(response.json()["response"])
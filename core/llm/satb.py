@@ -1,7 +1,7 @@
 from core.editor.session import EditorSession
-from core.score.reharmonize import replace_chord_in_measure
 from core.score.parser import load_musicxml
-from typing import Dict
+from core.score.reharmonize import replace_chords_in_measures
+from typing import Dict, Tuple
 
 class SATBLLM:
     """
@@ -11,11 +11,26 @@ class SATBLLM:
     def __init__(self, session: EditorSession, llm_interface):
         """
         session: EditorSession-Objekt
-        llm_interface: Objekt, das die LLM-Kommunikation kapselt (z.B. Ollama)
+        llm_interface: Objekt, das die LLM-Kommunikation kapselt (z.B. Ollama).
+            Muss generate_chord(prompt) anbieten; optional
+            generate_chords({measure: prompt}) für mehrere Takte in einem Aufruf.
         """
         self.session = session
         self.llm = llm_interface
 
+    @staticmethod
+    def _parse_response(response) -> Tuple[str, str]:
+        """
+        (root, quality) aus einer LLM-Antwort wie {"root": "A", "quality": "minor"}
+        """
+        if not response or "root" not in response:
+            raise ValueError("LLM konnte keinen Root-Akkord bestimmen")
+        return response["root"], response.get("quality", "major")
+
+    @staticmethod
+    def _chord_name(root: str, quality: str) -> str:
+        return root if quality == "major" else root + "m"
+
     def harmonize_prompt(self, measure_number: int, prompt: str):
         """
         LLM aufrufen und neuen Akkord für den angegebenen Takt erzeugen
@@ -23,25 +38,35 @@ class SATBLLM:
         # LLM-Response simulieren
         # Erwartet Rückgabe z.B. {"root": "A", "quality": "minor"}
         response = self.llm.generate_chord(prompt)
+        new_root, quality = self._parse_response(response)
 
-        if not response or "root" not in response:
-            raise ValueError("LLM konnte keinen Root-Akkord bestimmen")
-
-        new_root = response["root"]
-        quality = response.get("quality", "major")
-        chord_name = new_root if quality == "major" else new_root + "m"
-
-        replace_chord_in_measure(self.session.current_score, measure_number, chord_name)
-        self.session.apply_edit(self.session.current_score)
-        return chord_name
+        self.session.replace_chord(measure_number, new_root, quality)
+        return self._chord_name(new_root, quality)
 
     def harmonize_multiple(self, prompts: Dict[int, str]):
         """
         Mehrere Takte gleichzeitig harmonisieren
         prompts: dict von measure_number -> Prompt
+
+        Das LLM wird, falls es generate_chords anbietet, nur einmal gefragt.
+        Alle Akkorde werden als ein einziger Bearbeitungsschritt übernommen
+        (ein Undo macht alle rückgängig).
         """
-        results = {}
-        for measure, prompt in prompts.items():
-            chord_name = self.harmonize_prompt(measure, prompt)
-            results[measure] = chord_name
-        return results
+        generate_chords = getattr(self.llm, "generate_chords", None)
+        if generate_chords is not None:
+            responses = generate_chords(prompts)
+        else:
+            responses = {m: self.llm.generate_chord(p) for m, p in prompts.items()}
+
+        # Erst alle Antworten prüfen, damit ein Fehler nichts halb ändert
+        replacements = {
+            measure: self._parse_response(responses.get(measure))
+            for measure in prompts
+        }
+        with self.session.mutate() as score:
+            replace_chords_in_measures(score, replacements)
+
+        return {
+            measure: self._chord_name(root, quality)
+            for measure, (root, quality) in replacements.items()
+        }
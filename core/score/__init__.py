@@ -1,6 +1,33 @@
 # __init__.py für core.score
-from .parser import load_musicxml, write_musicxml
-from .harmony import analyze_chords
-from .reharmonize import replace_chord_in_measure  # nur die existierende Funktion importieren
-# von hier aus können andere Module spezifische Funktionen importieren
-from .llm import apply_llm_chords_to_measures
+#
+# Die Untermodule importieren music21; sie werden erst geladen, wenn eines
+# ihrer Symbole zum ersten Mal verwendet wird (PEP 562).
+import importlib
+
+# Name -> Untermodul, in dem er definiert ist
+_LAZY = {
+    "load_musicxml": "parser",
+    "write_musicxml": "writer",
+    "analyze_chords": "harmony",
+    "replace_chord_in_measure": "reharmonize",
+    "replace_chords_in_measures": "reharmonize",
+    "detect_voices": "voice_detection",
+    "apply_llm_chords_to_measures": "llm",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Im Modul ablegen, damit __getattr__ nur beim ersten Zugriff läuft
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
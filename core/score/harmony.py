@@ -1,21 +1,133 @@
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
 from music21 import harmony, chord, stream
 
+# Chord symbol per voicing (pitches with octaves), least recently used
+# first; None for chords that cannot be analyzed. music21's figure can
+# depend on the voicing, so octaves are part of the key. SATB scores reuse
+# a handful of voicings, so most lookups hit.
+_CHORD_SYMBOL_CACHE: "OrderedDict[Tuple[str, ...], Optional[harmony.ChordSymbol]]" = OrderedDict()
+_CHORD_SYMBOL_CACHE_SIZE = 512
+
+# Last analysis per score: the chord pitches and the symbols derived for
+# them, position by position. Dropped together with the score.
+_RESULT_CACHE: "WeakKeyDictionary[stream.Score, Tuple[List[tuple], List]]" = WeakKeyDictionary()
+
+# Figure suffix per set of (generic interval, semitones) above the root:
+# generic 0/2/4/6 are unison, third, fifth and seventh. Only tertian triads
+# and seventh chords spelled as such are listed; enharmonic spellings
+# (e.g. a diminished fourth for a major third) and everything else go
+# through music21.
+_FIGURE_SUFFIXES: Dict[FrozenSet[Tuple[int, int]], str] = {
+    frozenset(((0, 0), (2, 4), (4, 7))): "",
+    frozenset(((0, 0), (2, 3), (4, 7))): "m",
+    frozenset(((0, 0), (2, 3), (4, 6))): "dim",
+    frozenset(((0, 0), (2, 4), (4, 7), (6, 10))): "7",
+    frozenset(((0, 0), (2, 4), (4, 7), (6, 11))): "maj7",
+}
+
+_STEP_INDEX = {step: index for index, step in enumerate("CDEFGAB")}
+
+
+def _simple_figure(c: chord.Chord) -> Optional[str]:
+    """
+    Chord symbol figure for common triads and seventh chords, or None.
+
+    Gives the same figure as ``harmony.chordSymbolFigureFromChord`` for
+    the chords in ``_FIGURE_SUFFIXES``, without music21's general analysis.
+    """
+    # Step index and pitch class per pitch name
+    pitches = {p.name: (_STEP_INDEX[p.step], p.pitchClass) for p in c.pitches}
+    for root, (root_step, root_pc) in pitches.items():
+        suffix = _FIGURE_SUFFIXES.get(frozenset(
+            ((step - root_step) % 7, (pc - root_pc) % 12)
+            for step, pc in pitches.values()
+        ))
+        if suffix is not None:
+            bass = c.bass().name
+            return root + suffix + ("" if bass == root else "/" + bass)
+    return None
+
+
+def _derive_chord_symbol(c: chord.Chord) -> harmony.ChordSymbol:
+    """
+    Like ``harmony.chordSymbolFromChord``, with a fast path for common chords.
+    """
+    figure = _simple_figure(c)
+    if figure is None:
+        return harmony.chordSymbolFromChord(c)
+    cs = harmony.ChordSymbol(figure)
+    cs.pitches = c.pitches
+    return cs
+
+
+def _chord_key(c: chord.Chord) -> Optional[Tuple[str, ...]]:
+    """
+    Pitches of a chord with octaves, or None for an empty chord.
+    """
+    if not c.pitches:
+        return None
+    return tuple(p.nameWithOctave for p in c.pitches)
+
+
+def _chord_symbol(c: chord.Chord, key: Tuple[str, ...]) -> Optional[harmony.ChordSymbol]:
+    """
+    Chord symbol for a chord with the given key, like
+    ``harmony.chordSymbolFromChord``, derived once per voicing.
+
+    Returns a fresh copy carrying the pitches of ``c``, or None if music21
+    cannot analyze the chord.
+    """
+    try:
+        cached = _CHORD_SYMBOL_CACHE[key]
+        _CHORD_SYMBOL_CACHE.move_to_end(key)
+    except KeyError:
+        try:
+            cached = _derive_chord_symbol(c)
+        except Exception:
+            cached = None
+        _CHORD_SYMBOL_CACHE[key] = cached
+        if len(_CHORD_SYMBOL_CACHE) > _CHORD_SYMBOL_CACHE_SIZE:
+            _CHORD_SYMBOL_CACHE.popitem(last=False)
+    if cached is None:
+        return None
+    cs = deepcopy(cached)
+    cs.pitches = c.pitches
+    return cs
+
+
 def analyze_chords(score: stream.Score):
     """
     Analyze the chords of a score and return a list of chord symbols.
 
+    Repeated calls on the same score are incremental: chords that are
+    unchanged since the last call (same position and pitches) keep
+    their chord symbol, so the symbols are shared between the results of
+    such calls and should be copied before modifying them.
+
     Args:
         score (music21.stream.Score): The score to analyze.
 
     Returns:
         List[music21.harmony.ChordSymbol]: List of chord symbols in the score.
     """
-    chords_list = []
-    for c in score.chords:  # Iterate over all chords in the score
-        try:
-            cs = harmony.chordSymbolFromChord(c)
-            chords_list.append(cs)
-        except Exception:
-            # Skip chords that cannot be analyzed
+    previous_keys, previous_symbols = _RESULT_CACHE.get(score, ((), ()))
+    keys = []
+    symbols = []
+    # A single pass over the score (Stream.chords no longer exists)
+    for c in score.recurse().getElementsByClass(chord.Chord):
+        key = _chord_key(c)
+        if key is None:
             continue
-    return chords_list
+        index = len(keys)
+        keys.append(key)
+        if index < len(previous_keys) and previous_keys[index] == key:
+            symbols.append(previous_symbols[index])
+        else:
+            symbols.append(_chord_symbol(c, key))
+    _RESULT_CACHE[score] = (keys, symbols)
+    # Skip chords that cannot be analyzed
+    return [cs for cs in symbols if cs is not None]
@@ -1,3 +0,0 @@
-from .parser import load_musicxml, write_musicxml
-from .reharmonize import replace_chord_in_measure, replace_chords_in_measures
-from .llm import apply_llm_chords_to_measures
@@ -11,9 +11,12 @@ This module provides an interactive score viewer that can:
 import gradio as gr
 import tempfile
 import base64
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 from io import BytesIO
 
@@ -23,10 +26,16 @@ try:
     from music21 import instrument
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
+    # Set font once instead of on every render
+    matplotlib.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans']})
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
+    import numpy as np
     from matplotlib.backends.backend_agg import FigureCanvasAgg
     from matplotlib.animation import FuncAnimation
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+    from PIL import Image as PILImage  # installed with matplotlib
     MUSIC21_AVAILABLE = True
 except ImportError:
     MUSIC21_AVAILABLE = False
@@ -36,6 +45,50 @@ except ImportError:
     patches = None
 
 
+def _measure_positions(score) -> list:
+    """Calculate start/end times for each measure of a score."""
+    # Get the first part for timing calculation
+    if not score.parts:
+        return []
+    
+    measures = list(score.parts[0].getElementsByClass('Measure'))
+    # Measure duration from the notes directly in it; start and end times
+    # follow as running sums over all measures
+    note_classes = (note.Note, chord.Chord)
+    durations = np.fromiter(
+        (float(sum(element.duration.quarterLength
+                   for element in measure.getElementsByClass(note_classes)))
+         for measure in measures),
+        dtype=float, count=len(measures),
+    )
+    ends = np.cumsum(durations)
+    starts = np.concatenate(([0.0], ends[:-1]))
+    
+    return [
+        {'start': start, 'end': end, 'number': measure.number, 'duration': duration}
+        for measure, start, end, duration
+        in zip(measures, starts.tolist(), ends.tolist(), durations.tolist())
+    ]
+
+
+def _part_names(score) -> list:
+    """Name of each part; parts without a name are numbered."""
+    return [part.partName or f'Part {i + 1}' for i, part in enumerate(score.parts)]
+
+
+@lru_cache(maxsize=8)
+def _load_cached(score_path: str, mtime: float):
+    """
+    Parse a MusicXML file and calculate its measure positions and part names.
+    
+    Keyed by path and modification time, so moving the cursor reuses the
+    parsed score while a changed file is parsed again. The results are
+    shared between viewers and must not be modified.
+    """
+    score = converter.parse(score_path)
+    return score, _measure_positions(score), _part_names(score)
+
+
 class InteractiveScoreViewer:
     """Interactive score viewer with playback cursor support."""
     
@@ -46,6 +99,13 @@ class InteractiveScoreViewer:
         self.is_playing = False
         self.playback_thread = None
         self.measure_positions = []  # List of (measure_start_time, measure_end_time, measure_number)
+        self.part_names = []
+        # End time of each measure, for lookups by time
+        self._measure_ends = None
+        self._measure_ends_source = None
+        # Figure with the static score drawing, built once per score
+        self._figure = None
+        self._figure_score = None
         
     def load_score(self, score_path: str) -> bool:
         """Load a MusicXML score and prepare for display."""
@@ -53,48 +113,30 @@ class InteractiveScoreViewer:
             return False
         
         try:
-            self.current_score = converter.parse(score_path)
-            self._calculate_measure_positions()
+            self.current_score, self.measure_positions, self.part_names = _load_cached(
+                score_path, os.path.getmtime(score_path)
+            )
             return True
         except Exception as e:
             print(f"Error loading score: {e}")
             return False
     
     def _calculate_measure_positions(self):
-        """Calculate start/end times for each measure."""
+        """Calculate start/end times for each measure (and the part names)."""
         if not self.current_score:
             return
         
-        self.measure_positions = []
-        current_time = 0.0
-        
-        # Get the first part for timing calculation
-        if self.current_score.parts:
-            first_part = self.current_score.parts[0]
-            
-            for measure in first_part.getElementsByClass('Measure'):
-                measure_duration = 0.0
-                
-                # Calculate measure duration from notes
-                for element in measure.getElementsByClass(['Note', 'Chord']):
-                    if hasattr(element, 'quarterLength'):
-                        measure_duration += element.quarterLength
-                
-                # Store measure position
-                measure_end_time = current_time + measure_duration
-                self.measure_positions.append({
-                    'start': current_time,
-                    'end': measure_end_time,
-                    'number': measure.number,
-                    'duration': measure_duration
-                })
-                
-                current_time = measure_end_time
+        self.measure_positions = _measure_positions(self.current_score)
+        self.part_names = _part_names(self.current_score)
     
     def render_score_image(self, cursor_time: Optional[float] = None) -> str:
         """
         Render the score as an image with optional playback cursor.
         
+        The score itself is drawn once and kept; later calls only redraw
+        the cursor on top of it. Replace ``current_score`` rather than
+        modifying it in place to get a fresh drawing.
+        
         Args:
             cursor_time: Current playback time in seconds
             
@@ -105,63 +147,25 @@ class InteractiveScoreViewer:
             return None
         
         try:
-            # Create figure with appropriate size
-            fig, ax = plt.subplots(1, 1, figsize=(14, 8))
-            ax.set_xlim(0, 100)
-            ax.set_ylim(0, 50)
-            ax.set_aspect('equal')
-            ax.axis('off')
+            if self._figure is None or self._figure_score is not self.current_score:
+                self._figure = self._build_figure()
+                self._figure_score = self.current_score
+            canvas, background, cursor_line, cursor_label, crop = self._figure
             
-            # Set font
-            plt.rcParams['font.family'] = 'sans-serif'
-            plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
+            # Start from the static drawing and add the cursor, if any
+            canvas.restore_region(background)
+            if cursor_time is not None and self._draw_playback_cursor(
+                    cursor_line, cursor_label, cursor_time):
+                canvas.figure.draw_artist(cursor_line)
+                canvas.figure.draw_artist(cursor_label)
             
-            # Draw staff lines for each part
-            y_offset = 40
-            for i, part in enumerate(self.current_score.parts[:4]):
-                part_name = getattr(part, 'partName', f'Part {i+1}')
-                
-                # Draw staff line
-                ax.plot([10, 90], [y_offset, y_offset], 'k-', linewidth=1)
-                
-                # Draw part name
-                ax.text(2, y_offset + 2, part_name[:10], fontsize=8, ha='left')
-                
-                # Draw measures and notes
-                for measure in part.getElementsByClass('Measure')[:8]:
-                    measure_x = 10 + measure.number * 10
-                    
-                    # Draw measure number
-                    ax.text(measure_x - 1, y_offset + 4, str(measure.number), 
-                           fontsize=6, ha='right', alpha=0.6)
-                    
-                    # Draw notes
-                    for element in measure.getElementsByClass(['Note', 'Chord']):
-                        if hasattr(element, 'pitch'):
-                            note_y = y_offset + (element.pitch.midi % 12) * 0.3 - 1
-                            
-                            # Color based on voice
-                            voice_colors = ['red', 'blue', 'green', 'orange']
-                            color = voice_colors[i % len(voice_colors)]
-                            
-                            ax.plot(measure_x, note_y, 'o', color=color, markersize=4, zorder=10)
-                
-                y_offset -= 8
-            
-            # Draw playback cursor if specified
-            if cursor_time is not None:
-                self._draw_playback_cursor(ax, cursor_time)
-            
-            # Add title
-            plt.title(f"Interactive Score Viewer - {len(self.current_score.parts)} parts")
-            plt.tight_layout()
-            
-            # Convert to base64
+            # Convert to base64; the figure is opaque, so the alpha channel
+            # is dropped, and encoding (most of the time per frame) uses
+            # fast compression
             buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode()
-            plt.close()
+            pixels = np.asarray(canvas.buffer_rgba())[crop][..., :3]
+            PILImage.fromarray(pixels).save(buffer, "PNG", compress_level=1)
+            image_base64 = base64.b64encode(buffer.getvalue()).decode()
             
             return f"data:image/png;base64,{image_base64}"
             
@@ -169,32 +173,133 @@ class InteractiveScoreViewer:
             print(f"Error rendering score: {e}")
             return None
     
-    def _draw_playback_cursor(self, ax, cursor_time: float):
-        """Draw a vertical line indicating current playback position."""
-        # Find current measure based on time
-        current_measure = None
-        for measure_pos in self.measure_positions:
-            if measure_pos['start'] <= cursor_time <= measure_pos['end']:
-                current_measure = measure_pos
-                break
-        
-        if current_measure:
-            # Calculate cursor position
-            measure_x = 10 + current_measure['number'] * 10
+    def _build_figure(self):
+        """
+        Draw the static part of the score.
+        
+        Returns:
+            Tuple of (canvas, background, cursor line, cursor label, crop),
+            where background is the rendered drawing without the cursor and
+            crop selects the area that ``bbox_inches='tight'`` would keep
+        """
+        # A figure outside of pyplot, so it can be kept without leaking
+        fig = Figure(figsize=(14, 8), dpi=100)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        ax.set_xlim(0, 100)
+        ax.set_ylim(0, 50)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        
+        # Collect staff lines and notes, then draw each kind in one call
+        voice_colors = ['red', 'blue', 'green', 'orange']
+        staff_lines = []
+        note_xs, note_ys, note_colors = [], [], []
+        
+        # Names come with the loaded score; fall back if it was set directly
+        part_names = self.part_names or _part_names(self.current_score)
+        
+        y_offset = 40
+        for i, (part, part_name) in enumerate(zip(self.current_score.parts[:4], part_names)):
+            # Staff line
+            staff_lines.append([(10, y_offset), (90, y_offset)])
+            
+            # Draw part name
+            ax.text(2, y_offset + 2, part_name[:10], fontsize=8, ha='left')
+            
+            # Color based on voice
+            color = voice_colors[i % len(voice_colors)]
             
-            # Draw vertical cursor line
-            ax.axvline(x=measure_x, color='red', linewidth=2, alpha=0.8, zorder=20)
+            # Draw measures and notes
+            for measure in part.getElementsByClass('Measure')[:8]:
+                measure_x = 10 + measure.number * 10
+                
+                # Draw measure number
+                ax.text(measure_x - 1, y_offset + 4, str(measure.number), 
+                       fontsize=6, ha='right', alpha=0.6)
+                
+                # Notes
+                for element in measure.getElementsByClass(['Note', 'Chord']):
+                    if hasattr(element, 'pitch'):
+                        note_xs.append(measure_x)
+                        note_ys.append(y_offset + (element.pitch.midi % 12) * 0.3 - 1)
+                        note_colors.append(color)
             
-            # Add cursor label
-            ax.text(measure_x, 45, f'▶ {cursor_time:.1f}s', 
-                   fontsize=8, color='red', ha='center', zorder=21)
+            y_offset -= 8
+        
+        ax.add_collection(LineCollection(staff_lines, colors='k', linewidths=1))
+        ax.scatter(note_xs, note_ys, c=note_colors, s=16, zorder=10)
+        
+        # Add title
+        ax.set_title(f"Interactive Score Viewer - {len(self.current_score.parts)} parts")
+        fig.tight_layout()
+        
+        # Cursor artists are animated: left out of the background and
+        # drawn on top of it per render
+        cursor_line = ax.axvline(x=0, color='red', linewidth=2, alpha=0.8,
+                                 zorder=20, animated=True)
+        cursor_label = ax.text(0, 45, '', fontsize=8, color='red',
+                               ha='center', zorder=21, animated=True)
+        
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        
+        # Pixel area of the tight bounding box (with the default padding);
+        # image rows run from the top
+        bbox = fig.get_tightbbox(canvas.get_renderer()).padded(0.1)
+        width, height = canvas.get_width_height()
+        left = max(int(np.floor(bbox.x0 * fig.dpi)), 0)
+        right = min(int(np.ceil(bbox.x1 * fig.dpi)), width)
+        top = max(height - int(np.ceil(bbox.y1 * fig.dpi)), 0)
+        bottom = min(height - int(np.floor(bbox.y0 * fig.dpi)), height)
+        crop = (slice(top, bottom), slice(left, right))
+        
+        return canvas, background, cursor_line, cursor_label, crop
+    
+    def _draw_playback_cursor(self, cursor_line, cursor_label, cursor_time: float) -> bool:
+        """
+        Move the cursor artists to the current playback position.
+        
+        Returns:
+            False if the time lies outside of all measures
+        """
+        # Find current measure based on time
+        current_measure = self._measure_at(cursor_time)
+        
+        if not current_measure:
+            return False
+        
+        # Calculate cursor position
+        measure_x = 10 + current_measure['number'] * 10
+        
+        # Vertical cursor line and label
+        cursor_line.set_xdata([measure_x, measure_x])
+        cursor_label.set_x(measure_x)
+        cursor_label.set_text(f'▶ {cursor_time:.1f}s')
+        return True
+    
+    def _measure_at(self, time: float) -> Optional[Dict[str, Any]]:
+        """
+        Position entry of the first measure whose time span contains ``time``.
+        
+        End times never decrease, so the measure is found by binary search
+        over them; the array is rebuilt when ``measure_positions`` changes.
+        """
+        if self._measure_ends_source is not self.measure_positions:
+            self._measure_ends = np.array([m['end'] for m in self.measure_positions])
+            self._measure_ends_source = self.measure_positions
+        
+        index = int(np.searchsorted(self._measure_ends, time, side='left'))
+        if index < len(self.measure_positions):
+            measure_pos = self.measure_positions[index]
+            if measure_pos['start'] <= time:
+                return measure_pos
+        return None
     
     def get_measure_at_time(self, time: float) -> Optional[int]:
         """Get the measure number at a specific time."""
-        for measure_pos in self.measure_positions:
-            if measure_pos['start'] <= time <= measure_pos['end']:
-                return measure_pos['number']
-        return None
+        measure_pos = self._measure_at(time)
+        return measure_pos['number'] if measure_pos else None
     
     def get_score_info(self) -> Dict[str, Any]:
         """Get information about the loaded score."""
@@ -205,13 +310,9 @@ class InteractiveScoreViewer:
             'parts': len(self.current_score.parts),
             'measures': len(self.measure_positions),
             'duration': self.measure_positions[-1]['end'] if self.measure_positions else 0,
-            'part_names': []
+            'part_names': list(self.part_names or _part_names(self.current_score))
         }
         
-        for part in self.current_score.parts:
-            part_name = getattr(part, 'partName', f'Part {len(info["part_names"]) + 1}')
-            info['part_names'].append(part_name)
-        
         return info
 
 
@@ -353,10 +454,39 @@ def create_comparison_viewer() -> gr.Column:
     return comp_col
 
 
+def _load_comparison_score(viewer: InteractiveScoreViewer, file_obj) -> bool:
+    """Load one side of the comparison; False if there is no file."""
+    if not file_obj:
+        return False
+    
+    if hasattr(file_obj, 'name'):
+        file_path = file_obj.name
+    else:
+        file_path = str(file_obj)
+    
+    return viewer.load_score(file_path)
+
+
+def _render_comparison_side(viewer: InteractiveScoreViewer, loaded, empty_info: str,
+                            label: str) -> Tuple[str, str]:
+    """Render one side of the comparison once its score is loaded."""
+    try:
+        if not loaded.result():
+            return None, empty_info
+        image = viewer.render_score_image()
+        info_dict = viewer.get_score_info()
+        return image, f"Parts: {info_dict.get('parts', 0)}\nMeasures: {info_dict.get('measures', 0)}"
+    except Exception as e:
+        return None, f"❌ {label} error: {e}"
+
+
 def update_comparison(input_file, output_file) -> Tuple[str, str, str, str]:
     """
     Update the comparison view with input and output scores.
     
+    Both scores are parsed at the same time; they are rendered one after
+    the other.
+    
     Args:
         input_file: Original MusicXML file
         output_file: Harmonized MusicXML file
@@ -364,43 +494,17 @@ def update_comparison(input_file, output_file) -> Tuple[str, str, str, str]:
     Returns:
         Tuple of (input_image, input_info, output_image, output_info)
     """
-    # Load input score
     input_viewer = InteractiveScoreViewer()
-    input_image = None
-    input_info = "No input file"
-    
-    if input_file:
-        try:
-            if hasattr(input_file, 'name'):
-                input_path = input_file.name
-            else:
-                input_path = str(input_file)
-            
-            if input_viewer.load_score(input_path):
-                input_image = input_viewer.render_score_image()
-                input_info_dict = input_viewer.get_score_info()
-                input_info = f"Parts: {input_info_dict.get('parts', 0)}\nMeasures: {input_info_dict.get('measures', 0)}"
-        except Exception as e:
-            input_info = f"❌ Input error: {e}"
-    
-    # Load output score
     output_viewer = InteractiveScoreViewer()
-    output_image = None
-    output_info = "No output file"
     
-    if output_file:
-        try:
-            if hasattr(output_file, 'name'):
-                output_path = output_file.name
-            else:
-                output_path = str(output_file)
-            
-            if output_viewer.load_score(output_path):
-                output_image = output_viewer.render_score_image()
-                output_info_dict = output_viewer.get_score_info()
-                output_info = f"Parts: {output_info_dict.get('parts', 0)}\nMeasures: {output_info_dict.get('measures', 0)}"
-        except Exception as e:
-            output_info = f"❌ Output error: {e}"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        input_loaded = executor.submit(_load_comparison_score, input_viewer, input_file)
+        output_loaded = executor.submit(_load_comparison_score, output_viewer, output_file)
+    
+    input_image, input_info = _render_comparison_side(
+        input_viewer, input_loaded, "No input file", "Input")
+    output_image, output_info = _render_comparison_side(
+        output_viewer, output_loaded, "No output file", "Output")
     
     return input_image, input_info, output_image, output_info
 
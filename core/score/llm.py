@@ -6,10 +6,15 @@ def apply_llm_chords_to_measures(score, llm_results):
     llm_results: dict, z.B.
         {'S': {'measure': 1, 'root': 'C', 'quality': 'major'}, ...}
     """
+    # Alle Ergebnisse sammeln und in einem Durchgang anwenden;
+    # bei mehreren Ergebnissen für denselben Takt gilt das letzte
+    replacements = {}
     for voice, data in llm_results.items():
         measure = data.get("measure")
         root = data.get("root")
         quality = data.get("quality", "major")
         if measure is not None and root is not None:
-            replace_chords_in_measures(score, {measure: (root, quality)})
+            replacements[measure] = (root, quality)
+    if replacements:
+        replace_chords_in_measures(score, replacements)
     return score
@@ -1,25 +1,36 @@
+import os
+from functools import lru_cache
+
 from music21 import converter, stream
 
+from .utils import fast_clone_score
+from .writer import write_musicxml  # re-exported for existing imports
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(file_path: str, mtime: float) -> stream.Score:
+    """
+    Parse a MusicXML file once per path and modification time.
+
+    music21's own pickle cache is used explicitly, so even the first load
+    in a process skips the XML import for a file seen before.
+    """
+    return converter.parse(file_path, forceSource=False, storePickle=True)
+
+
 def load_musicxml(file_path: str) -> stream.Score:
     """
     Load a MusicXML file and return a music21 Score object.
 
+    Repeated loads of an unchanged file return a copy of the score parsed
+    the first time, so callers may edit the result freely.
+
     Args:
         file_path (str): Path to the MusicXML file.
 
     Returns:
         music21.stream.Score: Parsed score object.
     """
-    score = converter.parse(file_path)
-    return score
-
-def write_musicxml(score: stream.Score, file_path: str):
-    """
-    Write a music21 Score object to a MusicXML file.
-
-    Args:
-        score (music21.stream.Score): Score to export.
-        file_path (str): Destination file path.
-    """
-    score.write('musicxml', fp=file_path)
-
+    file_path = str(file_path)
+    score = _parse_cached(file_path, os.path.getmtime(file_path))
+    return fast_clone_score(score)
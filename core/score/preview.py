@@ -22,9 +22,14 @@ try:
     from music21.musicxml.xmlToM21 import MusicXMLImporter
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
+    # Set font once instead of on every render
+    matplotlib.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans']})
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
+    import numpy as np
     from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
     MUSIC21_AVAILABLE = True
 except ImportError:
     MUSIC21_AVAILABLE = False
@@ -33,6 +38,111 @@ except ImportError:
     stream = None
     patches = None
 
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow is optional; without it matplotlib draws the preview
+    Image = None
+
+# Pixels per preview unit (the preview spans 100 x 40 units) and the
+# height of the title bar for the Pillow preview
+_PREVIEW_SCALE = 6
+_PREVIEW_TITLE_HEIGHT = 24
+
+
+def _preview_layout(score_obj):
+    """
+    Positions of the preview elements in preview units (y grows upwards).
+    
+    Returns:
+        tuple: (staff y positions, part labels, note (x, y) positions)
+    """
+    staff_ys = []
+    labels = []
+    note_positions = []
+    y_offset = 35
+    for i, part in enumerate(score_obj.parts[:4]):  # Limit to first 4 parts
+        staff_ys.append(y_offset)
+        labels.append((y_offset + 2, f'Part {i + 1}'))
+        
+        # Notes (simple dots)
+        note_count = 0
+        for measure in part.getElementsByClass('Measure')[:8]:  # Show first 8 measures
+            if note_count >= 16:  # Limit total notes
+                break
+            measure_x = 10 + measure.number * 10
+            for note in measure.getElementsByClass(['Note', 'Chord']):
+                if note_count >= 16:
+                    break
+                note_positions.append((measure_x, y_offset + (note.pitch.midi % 12) * 0.3 - 1))
+                note_count += 1
+        
+        y_offset -= 7
+    return staff_ys, labels, note_positions
+
+
+def _draw_preview_pil(score_obj) -> bytes:
+    """Draw the preview with Pillow and return it as PNG data."""
+    staff_ys, labels, note_positions = _preview_layout(score_obj)
+    
+    scale = _PREVIEW_SCALE
+    width, height = 100 * scale, 40 * scale + _PREVIEW_TITLE_HEIGHT
+    
+    def to_pixels(x, y):
+        return x * scale, _PREVIEW_TITLE_HEIGHT + (40 - y) * scale
+    
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+    
+    draw.text((width / 2, _PREVIEW_TITLE_HEIGHT / 2),
+              f"Score Preview - {len(score_obj.parts)} parts",
+              fill="black", font=font, anchor="mm")
+    for y in staff_ys:
+        draw.line([to_pixels(10, y), to_pixels(90, y)], fill="black", width=1)
+    for y, label in labels:
+        draw.text(to_pixels(2, y), label, fill="black", font=font, anchor="ls")
+    for x, y in note_positions:
+        px, py = to_pixels(x, y)
+        draw.ellipse((px - 2, py - 2, px + 2, py + 2), fill="red")
+    
+    buffer = BytesIO()
+    image.save(buffer, "PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def _draw_preview_matplotlib(score_obj) -> bytes:
+    """Draw the preview with matplotlib and return it as PNG data."""
+    staff_ys, labels, note_positions = _preview_layout(score_obj)
+    
+    # Same pixel size and layout as the Pillow preview: the axes fill the
+    # figure below the title bar, so no tight bounding box is needed
+    dpi = 80
+    width, height = 100 * _PREVIEW_SCALE, 40 * _PREVIEW_SCALE + _PREVIEW_TITLE_HEIGHT
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 40 * _PREVIEW_SCALE / height])
+    
+    ax.set_xlim(0, 100)
+    ax.set_ylim(0, 40)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    
+    # Staff lines and notes are drawn in one call each
+    ax.add_collection(LineCollection([[(10, y), (90, y)] for y in staff_ys],
+                                     colors='k', linewidths=1))
+    for y, label in labels:
+        ax.text(2, y, label, fontsize=8, ha='left')
+    if note_positions:
+        note_xs, note_ys = zip(*note_positions)
+        ax.scatter(note_xs, note_ys, c='r', s=9, zorder=10)
+    
+    # Simple title without special characters
+    ax.set_title(f"Score Preview - {len(score_obj.parts)} parts")
+    
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', pil_kwargs={'compress_level': 1})
+    return buffer.getvalue()
+
 
 def create_score_preview(score_obj):
     """
@@ -48,53 +158,13 @@ def create_score_preview(score_obj):
         return None  # Return None for Gradio to handle gracefully
     
     try:
-        # Create a simple visualization - use ASCII-friendly approach
-        fig, ax = plt.subplots(1, 1, figsize=(10, 6))
-        
-        # Set font and avoid complex characters
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans', 'Liberation Sans']
-        
-        ax.set_xlim(0, 100)
-        ax.set_ylim(0, 40)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        # Simple score representation without complex text
-        y_offset = 35
-        for i, part in enumerate(score_obj.parts[:4]):  # Limit to first 4 parts
-            part_num = i + 1
-            
-            # Draw staff line
-            ax.plot([10, 90], [y_offset, y_offset], 'k-', linewidth=1)
-            
-            # Draw part number (simple, no complex characters)
-            ax.text(2, y_offset + 2, f'Part {part_num}', fontsize=8, ha='left')
-            
-            # Draw notes (simple dots)
-            note_count = 0
-            for measure in part.getElementsByClass('Measure')[:8]:  # Show first 8 measures
-                if note_count >= 16:  # Limit total notes
-                    break
-                measure_x = 10 + measure.number * 10
-                for note in measure.getElementsByClass(['Note', 'Chord']):
-                    if note_count >= 16:
-                        break
-                    note_y = y_offset + (note.pitch.midi % 12) * 0.3 - 1
-                    ax.plot(measure_x, note_y, 'ro', markersize=3, zorder=10)
-                    note_count += 1
-            
-            y_offset -= 7
-        
-        # Simple title without special characters
-        plt.title(f"Score Preview - {len(score_obj.parts)} parts")
-        
-        # Convert to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=80, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.read()).decode()
-        plt.close()
+        # Pillow draws the simple staff-and-dots picture directly; matplotlib
+        # is only needed when Pillow is missing
+        if Image is not None:
+            png = _draw_preview_pil(score_obj)
+        else:
+            png = _draw_preview_matplotlib(score_obj)
+        image_base64 = base64.b64encode(png).decode()
         
         return f"data:image/png;base64,{image_base64}"
         
@@ -124,7 +194,7 @@ def create_score_analysis(score_obj):
         analysis.append(f"**Parts:** {len(score_obj.parts)}")
         
         # Measure count
-        total_measures = len(score_obj.measureNumbers)
+        total_measures = len({m.number for m in score_obj.recurse().getElementsByClass('Measure')})
         analysis.append(f"**Measures:** {total_measures}")
         
         # Part details
@@ -134,31 +204,25 @@ def create_score_analysis(score_obj):
             part_name = getattr(part, 'partName', f'Voice {i+1}')
             part_measures = len(part.getElementsByClass('Measure'))
             
-            # Get pitch range
-            notes = [n for n in part.flat.getElementsByClass(['Note', 'Chord']) if hasattr(n, 'pitch')]
-            if notes:
-                pitches = [note.pitch.midi for note in notes]
-                min_pitch = min(pitches)
-                max_pitch = max(pitches)
+            # Get pitch range (of notes and chords)
+            pitches = np.fromiter((p.midi for p in part.flatten().pitches), dtype=np.int16)
+            if pitches.size:
+                min_pitch = pitches.min()
+                max_pitch = pitches.max()
                 analysis.append(f"  - **{part_name}**: {part_measures} measures, range {min_pitch}-{max_pitch}")
             else:
                 analysis.append(f"  - **{part_name}**: {part_measures} measures (no notes)")
         
-        # Time signature info
+        # Time and key signature info, from one flattened first part
         if score_obj.parts:
-            first_part = score_obj.parts[0]
-            time_sigs = first_part.flat.getElementsByClass('TimeSignature')
-            if time_sigs:
-                time_sig = time_sigs[0]
+            first_part = score_obj.parts[0].flatten()
+            time_sig = first_part.getElementsByClass('TimeSignature').first()
+            if time_sig is not None:
                 analysis.append(f"")
                 analysis.append(f"**Time Signature:** {time_sig.numerator}/{time_sig.denominator}")
-        
-        # Key signature info
-        if score_obj.parts:
-            first_part = score_obj.parts[0]
-            key_sigs = first_part.flat.getElementsByClass('KeySignature')
-            if key_sigs:
-                key_sig = key_sigs[0]
+            
+            key_sig = first_part.getElementsByClass('KeySignature').first()
+            if key_sig is not None:
                 analysis.append(f"**Key Signature:** {str(key_sig)}")
         
         return "\n".join(analysis)
@@ -1,5 +1,33 @@
-from music21 import chord, note, pitch, stream
-from copy import deepcopy
+from functools import lru_cache
+from music21 import chord, pitch, stream
+
+# Intervals above the root per chord quality
+_QUALITY_INTERVALS = {
+    'major': (0, 4, 7),
+    'minor': (0, 3, 7),
+    'dim': (0, 3, 6),
+}
+
+@lru_cache(maxsize=256)
+def _chord_midi(root: str, quality: str, base_octave: int) -> tuple:
+    """
+    MIDI numbers of the notes of a chord; raises ValueError if invalid.
+
+    Only the MIDI numbers are cached: every chord inserted into a score must
+    be a separate object with its own pitches (and accidentals), and building
+    them from MIDI numbers is cheaper than copying template pitches.
+    ``quality`` must be lower case.
+    """
+    try:
+        root_pitch = pitch.Pitch(f"{root}{base_octave}")
+    except Exception:
+        raise ValueError(f"Invalid root pitch: {root}")
+
+    intervals = _QUALITY_INTERVALS.get(quality)
+    if intervals is None:
+        raise ValueError(f"Unsupported chord quality: {quality}")
+
+    return tuple(root_pitch.midi + i for i in intervals)
 
 def make_chord(root: str, quality: str, base_octave: int = 4) -> chord.Chord:
     """
@@ -13,22 +41,17 @@ def make_chord(root: str, quality: str, base_octave: int = 4) -> chord.Chord:
     Returns:
         music21.chord.Chord: The generated chord.
     """
-    try:
-        root_pitch = pitch.Pitch(f"{root}{base_octave}")
-    except Exception:
-        raise ValueError(f"Invalid root pitch: {root}")
+    midi_numbers = _chord_midi(root, quality.lower(), base_octave)
+    return chord.Chord([pitch.Pitch(midi=midi) for midi in midi_numbers])
 
-    if quality.lower() == 'major':
-        intervals = [0, 4, 7]
-    elif quality.lower() == 'minor':
-        intervals = [0, 3, 7]
-    elif quality.lower() == 'dim':
-        intervals = [0, 3, 6]
-    else:
-        raise ValueError(f"Unsupported chord quality: {quality}")
+def _measure_containers(score: stream.Stream):
+    """
+    Streams that hold the measures: the parts of a score, or the stream
+    itself (e.g. a single part or a chordified score).
+    """
+    parts = list(score.getElementsByClass(stream.Part))
+    return parts or [score]
 
-    chord_notes = [note.Note(root_pitch.midi + i) for i in intervals]
-    return chord.Chord(chord_notes)
 
 def replace_chord_in_measure(score: stream.Score, measure_number: int, new_root: str, new_quality: str = 'major'):
     """
@@ -40,25 +63,40 @@ def replace_chord_in_measure(score: stream.Score, measure_number: int, new_root:
         new_root (str): Root note of the new chord.
         new_quality (str, optional): Quality of the new chord. Defaults to 'major'.
     """
-    measure = score.measure(measure_number)
-    if measure is None:
-        raise ValueError(f"Measure {measure_number} not found in score.")
-
-    new_ch = make_chord(new_root, new_quality)
-    # Remove existing chords
-    for c in measure.getElementsByClass(chord.Chord):
-        measure.remove(c)
-
-    # Insert the new chord at the beginning of the measure
-    measure.insert(0, new_ch)
+    replace_chords_in_measures(score, {measure_number: (new_root, new_quality)})
 
 def replace_chords_in_measures(score: stream.Score, replacements: dict):
     """
     Replace chords in multiple measures according to a dictionary mapping.
 
+    Each part is walked once; in every part, the existing chords of the
+    affected measures are removed and the new chord is inserted at the
+    beginning of the measure.
+
     Args:
         score (music21.stream.Score): The score to modify.
         replacements (dict): Dictionary mapping measure_number -> (root, quality)
+
+    Raises:
+        ValueError: If a measure does not exist or a chord is invalid. The
+            score is left unchanged in that case.
     """
-    for measure_num, (root, quality) in replacements.items():
-        replace_chord_in_measure(score, measure_num, root, quality)
+    # Check all chords before anything is modified
+    for root, quality in replacements.values():
+        _chord_midi(root, quality.lower(), 4)
+
+    targets = []
+    for container in _measure_containers(score):
+        for measure in container.getElementsByClass(stream.Measure):
+            if measure.number in replacements:
+                targets.append(measure)
+
+    missing = set(replacements) - {measure.number for measure in targets}
+    if missing:
+        raise ValueError(f"Measure {min(missing)} not found in score.")
+
+    for measure in targets:
+        # Remove existing chords
+        measure.removeByClass(chord.Chord)
+        # Insert the new chord at the beginning of the measure
+        measure.insert(0, make_chord(*replacements[measure.number]))
@@ -1,8 +1,106 @@
-import copy
-from music21 import stream
+import copyreg
+import io
+import pickle
+from music21 import base, sites, spanner, stream, variant
+from music21.common.objects import SlottedObjectMixin
 
 def clone_score(score: stream.Score) -> stream.Score:
     """
     Tiefe Kopie eines music21-Scores für Undo/Redo.
+
+    Verwendet ``fast_clone_score``.
+    """
+    return fast_clone_score(score)
+
+
+# Pro Klasse vorberechnete Reduktion: Tupel der Slot-Namen, "m21" für
+# Music21Objects oder None, wenn das Standardverhalten greifen soll
+_REDUCERS = {}
+
+
+def _reducer_for(obj):
+    cls = type(obj)
+    if cls is sites.Sites:
+        return "sites"
+    if isinstance(obj, base.Music21Object):
+        if cls.__getstate__ is base.Music21Object.__getstate__:
+            return "m21"
+    elif isinstance(obj, SlottedObjectMixin):
+        if cls.__getstate__ is SlottedObjectMixin.__getstate__:
+            return tuple(obj._getSlotsRecursive())
+    return None
+
+
+class _ScorePickler(pickle.Pickler):
+    """
+    Pickler mit schnellerem Zustand für music21-Objekte.
+
+    music21 sammelt die Slots bei jedem Objekt neu über die MRO ein; hier
+    geschieht das einmal pro Klasse. Abgeleitete Caches (``_cache``),
+    ``derivation``, ``activeSite`` und die ``sites`` werden nicht
+    mitkopiert; ``_relink`` baut die Sites nach dem Laden neu auf.
+    """
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        try:
+            reducer = _REDUCERS[cls]
+        except KeyError:
+            reducer = _REDUCERS[cls] = _reducer_for(obj)
+
+        if reducer is None:
+            return NotImplemented
+        if reducer == "sites":
+            return sites.Sites, ()
+        if reducer == "m21":
+            state = obj.__dict__.copy()
+            state['_derivation'] = None
+            state['_activeSite'] = None
+            if '_cache' in state:
+                state['_cache'] = {}
+        else:
+            instance_dict = getattr(obj, '__dict__', None)
+            state = instance_dict.copy() if instance_dict is not None else {}
+            for slot in reducer:
+                state[slot] = getattr(obj, slot, None)
+        return copyreg.__newobj__, (cls,), state
+
+
+def _relink(container: stream.Stream, seen: set):
+    """
+    Trägt einen frisch geladenen Stream wieder als Site seiner Elemente ein.
+
+    ``_offsetDict`` und ``sites`` sind nach ``id()`` indiziert und damit nach
+    dem Laden veraltet; beide werden hier für die neuen Objekte aufgebaut.
+    """
+    if id(container) in seen:
+        return
+    seen.add(id(container))
+
+    container._offsetDict = {
+        id(entry[1]): entry for entry in container._offsetDict.values()
+    }
+    for element in container._elements + container._endElements:
+        element.sites.add(container)
+        element.activeSite = container
+        if element.isStream:
+            _relink(element, seen)
+        elif isinstance(element, spanner.Spanner):
+            _relink(element.spannerStorage, seen)
+        elif isinstance(element, variant.Variant):
+            _relink(element._stream, seen)
+
+
+def fast_clone_score(score: stream.Score) -> stream.Score:
+    """
+    Tiefe Kopie eines music21-Scores über pickle statt deepcopy.
+
+    Liefert dieselbe Struktur wie ``copy.deepcopy``, ist aber deutlich
+    schneller, da pro Klasse vorberechnete Slots verwendet und Caches
+    verworfen werden.
     """
-    return copy.deepcopy(score)
+    buffer = io.BytesIO()
+    _ScorePickler(buffer, protocol=5).dump(score)
+    clone = pickle.loads(buffer.getbuffer())
+    _relink(clone, set())
+    return clone
@@ -1,3 +1,4 @@
+import numpy as np
 from music21 import stream, note
 from typing import Dict
 
@@ -9,15 +10,19 @@ VOICE_RANGES = {
     "bass": (36, 60),     # C2 – C4
 }
 
+# VOICE_RANGES as arrays, for checking all ranges at once
+_VOICE_NAMES = tuple(VOICE_RANGES)
+_RANGES = np.array(list(VOICE_RANGES.values()))
+
 
 def average_pitch(part: stream.Part) -> float:
-    pitches = []
-    for n in part.recurse().notes:
-        if isinstance(n, note.Note):
-            pitches.append(n.pitch.midi)
-    if not pitches:
+    pitches = np.fromiter(
+        (n.pitch.midi for n in part.recurse().getElementsByClass(note.Note)),
+        dtype=np.int16,
+    )
+    if pitches.size == 0:
         return -1
-    return sum(pitches) / len(pitches)
+    return float(pitches.mean())
 
 
 def detect_voice(part: stream.Part) -> str:
@@ -31,11 +36,11 @@ def detect_voice(part: stream.Part) -> str:
     if avg < 0:
         return "unknown"
 
-    for voice, (low, high) in VOICE_RANGES.items():
-        if low <= avg <= high:
-            return voice
-
-    return "unknown"
+    # First voice whose range contains the average
+    matches = (_RANGES[:, 0] <= avg) & (avg <= _RANGES[:, 1])
+    if not matches.any():
+        return "unknown"
+    return _VOICE_NAMES[int(matches.argmax())]
 
 
 def detect_voices(score: stream.Score) -> Dict[str, str]:
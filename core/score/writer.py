@@ -1,8 +1,38 @@
+from xml.etree.ElementTree import ElementTree
+
 from music21 import stream
+from music21.musicxml.helpers import indent
+from music21.musicxml.m21ToXml import GeneralObjectExporter, ScoreExporter
 
 
 def write_musicxml(score: stream.Score, path: str) -> None:
     """
     Write a music21 Score object to a MusicXML file.
+
+    The XML tree is serialized straight into the file instead of being
+    rendered to one large string first, as ``score.write`` does. Compressed
+    ``.mxl`` output is left to music21.
     """
-    score.write(fmt="musicxml", fp=path)
+    path = str(path)
+    if path.endswith('.mxl'):
+        score.write(fmt="musicxml", fp=path)
+        return
+
+    # Same preparation as score.write: a copy with makeNotation applied
+    general_exporter = GeneralObjectExporter(score)
+    exporter = ScoreExporter(general_exporter.fromGeneralObject(score))
+    exporter.parse()
+    root = exporter.xmlRoot
+
+    # Formatting as in music21's own output: indented, sorted attributes
+    indent(root)
+    root.tail = None
+    for element in root.iter():
+        if len(element.attrib) > 1:
+            attributes = sorted(element.attrib.items())
+            element.attrib.clear()
+            element.attrib.update(attributes)
+
+    with open(path, 'wb') as f:
+        f.write(exporter.xmlHeader())
+        ElementTree(root).write(f, encoding='utf-8')
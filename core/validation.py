@@ -7,6 +7,7 @@ to ensure data integrity and security throughout the application.
 
 import os
 import re
+import sys
 from pathlib import Path
 from typing import Union, List, Optional, Any, Dict
 from music21 import stream
@@ -17,6 +18,34 @@ from core.exceptions import (
     InvalidTuningError, InvalidScoreError, VoiceDetectionError
 )
 
+# Potentially malicious prompt content: script tags and the JavaScript,
+# data and VBScript protocols, fused into one pattern
+_DANGEROUS_PROMPT_RE = re.compile(
+    r'<script.*?>.*?</script>|javascript:|data:|vbscript:',
+    re.IGNORECASE
+)
+
+# Path separators and characters unsafe in filenames become '_',
+# control characters are removed
+_FILENAME_TABLE = str.maketrans(
+    {**{c: '_' for c in '/\\<>:"|?*'},
+     **{c: None for c in range(0x20)}, 0x7f: None}
+)
+
+_MAX_MUSICXML_BYTES = 50 * 1024 * 1024  # 50 MB
+
+# Limits read once instead of on every call
+_MIN_TUNING, _MAX_TUNING = ValidationLimits.MIN_TUNING, ValidationLimits.MAX_TUNING
+_MIN_TEMPO, _MAX_TEMPO = ValidationLimits.MIN_TEMPO, ValidationLimits.MAX_TEMPO
+_NUMBER_TYPES = (int, float)
+
+# Voice indicators in part and instrument names
+_VOICE_NAME_RE = re.compile('|'.join(VoiceInfo.SATB_VOICES))
+_VOICE_LETTERS = {'s': 'soprano', 'a': 'alto', 't': 'tenor', 'b': 'bass'}
+_VOICE_LETTER_RE = re.compile('[satb]')
+
+_SESSION_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
 
 def validate_musicxml_path(file_path: Union[str, Path]) -> Path:
     """Validate MusicXML file path and existence.
@@ -34,9 +63,11 @@ def validate_musicxml_path(file_path: Union[str, Path]) -> Path:
     """
     path_obj = Path(file_path)
     
-    # Check if file exists
-    if not path_obj.exists():
-        raise FileNotFoundError(str(path_obj))
+    # Check if file exists; the same stat result gives the size below
+    try:
+        file_size = path_obj.stat().st_size
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(str(path_obj)) from None
     
     # Check file extension
     valid_extensions = [FileExtensions.MUSICXML, FileExtensions.MUSICXML_COMPRESSED]
@@ -48,10 +79,8 @@ def validate_musicxml_path(file_path: Union[str, Path]) -> Path:
         )
     
     # Check file size
-    file_size = path_obj.stat().st_size
-    max_size = 50 * 1024 * 1024  # 50 MB
-    if file_size > max_size:
-        raise FileSizeError(str(path_obj), file_size, max_size)
+    if file_size > _MAX_MUSICXML_BYTES:
+        raise FileSizeError(str(path_obj), file_size, _MAX_MUSICXML_BYTES)
     
     return path_obj
 
@@ -68,18 +97,18 @@ def validate_base_tuning(tuning: float) -> float:
     Raises:
         InvalidTuningError: If tuning is out of valid range
     """
-    if not isinstance(tuning, (int, float)):
+    if not isinstance(tuning, _NUMBER_TYPES):
         raise InvalidTuningError(
             float(tuning) if hasattr(tuning, '__float__') else 0.0,
-            ValidationLimits.MIN_TUNING,
-            ValidationLimits.MAX_TUNING
+            _MIN_TUNING,
+            _MAX_TUNING
         )
     
-    if not ValidationLimits.MIN_TUNING <= tuning <= ValidationLimits.MAX_TUNING:
+    if not _MIN_TUNING <= tuning <= _MAX_TUNING:
         raise InvalidTuningError(
             tuning,
-            ValidationLimits.MIN_TUNING,
-            ValidationLimits.MAX_TUNING
+            _MIN_TUNING,
+            _MAX_TUNING
         )
     
     return float(tuning)
@@ -97,16 +126,16 @@ def validate_tempo(tempo: Union[int, float]) -> float:
     Raises:
         ValidationError: If tempo is out of valid range
     """
-    if not isinstance(tempo, (int, float)):
+    if not isinstance(tempo, _NUMBER_TYPES):
         raise ValidationError(
             f"Invalid tempo type: {type(tempo)}",
             field="tempo",
             value=tempo
         )
     
-    if not ValidationLimits.MIN_TEMPO <= tempo <= ValidationLimits.MAX_TEMPO:
+    if not _MIN_TEMPO <= tempo <= _MAX_TEMPO:
         raise ValidationError(
-            f"Tempo {tempo} BPM is out of range ({ValidationLimits.MIN_TEMPO}-{ValidationLimits.MAX_TEMPO} BPM)",
+            f"Tempo {tempo} BPM is out of range ({_MIN_TEMPO}-{_MAX_TEMPO} BPM)",
             field="tempo",
             value=tempo
         )
@@ -134,14 +163,15 @@ def validate_voice_name(voice: str) -> str:
         )
     
     normalized_voice = voice.lower().strip()
-    if normalized_voice not in VoiceInfo.SATB_VOICES:
+    if normalized_voice not in VoiceInfo.SATB_VOICES_SET:
         raise ValidationError(
-            f"Invalid voice: {voice}. Must be one of: {', '.join(VoiceInfo.SATB_VOICES)}",
+            f"Invalid voice: {voice}. Must be one of: {VoiceInfo.SATB_VOICES_STR}",
             field="voice",
             value=voice
         )
     
-    return normalized_voice
+    # Intern so lookups in the voice tables of core.constants hit by identity
+    return sys.intern(normalized_voice)
 
 
 def validate_llm_prompt(prompt: str, max_length: int = 1000) -> str:
@@ -183,25 +213,49 @@ def validate_llm_prompt(prompt: str, max_length: int = 1000) -> str:
             value=cleaned_prompt
         )
     
-    # Check for potentially malicious content
-    dangerous_patterns = [
-        r'<script.*?>.*?</script>',  # Script tags
-        r'javascript:',              # JavaScript protocol
-        r'data:',                    # Data protocol
-        r'vbscript:',                # VBScript protocol
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, cleaned_prompt, re.IGNORECASE):
-            raise ValidationError(
-                "Prompt contains potentially dangerous content",
-                field="prompt",
-                value=cleaned_prompt
-            )
+    # Check for potentially malicious content; every pattern contains '<'
+    # or ':', so prompts without either skip the regex
+    if (('<' in cleaned_prompt or ':' in cleaned_prompt)
+            and _DANGEROUS_PROMPT_RE.search(cleaned_prompt)):
+        raise ValidationError(
+            "Prompt contains potentially dangerous content",
+            field="prompt",
+            value=cleaned_prompt
+        )
     
     return cleaned_prompt
 
 
+def _detect_voice_indicator(part: stream.Part) -> Optional[str]:
+    """Detect the voice of a part from its part or instrument name.
+    
+    Full voice names are preferred; otherwise the first of the letters
+    s, a, t or b in the names maps to its voice, so abbreviations and
+    names such as German 'Sopran' or 'Alt' are accepted as well.
+    
+    Args:
+        part: Music21 Part object
+        
+    Returns:
+        Voice name, or None if the names contain no voice indicator
+    """
+    part_name = (part.partName or '').lower()
+    instrument_name = ''
+    if hasattr(part, 'getInstrument'):
+        instrument = part.getInstrument()
+        if instrument:
+            instrument_name = (getattr(instrument, 'instrumentName', None) or '').lower()
+    
+    names = part_name + ' ' + instrument_name
+    match = _VOICE_NAME_RE.search(names)
+    if match:
+        return match.group(0)
+    match = _VOICE_LETTER_RE.search(names)
+    if match:
+        return _VOICE_LETTERS[match.group(0)]
+    return None
+
+
 def validate_score_structure(score: stream.Score) -> stream.Score:
     """Validate music21 score structure.
     
@@ -222,17 +276,21 @@ def validate_score_structure(score: stream.Score) -> stream.Score:
         )
     
     # Check if score has parts
-    if len(score.parts) == 0:
+    parts = list(score.parts)
+    if not parts:
         raise InvalidScoreError(
             "Score has no parts",
             issue="No parts found"
         )
     
-    # Check if score has measures
-    has_measures = False
-    for part in score.parts:
-        if len(part.getElementsByClass('Measure')) > 0:
-            has_measures = True
+    # Look for measures and a voice in one pass over the parts
+    has_measures = has_voice = False
+    for part in parts:
+        if not has_measures:
+            has_measures = bool(part.getElementsByClass('Measure'))
+        if not has_voice:
+            has_voice = _detect_voice_indicator(part) is not None
+        if has_measures and has_voice:
             break
     
     if not has_measures:
@@ -241,29 +299,8 @@ def validate_score_structure(score: stream.Score) -> stream.Score:
             issue="No measures found"
         )
     
-    # Validate voice detection
-    detected_voices = []
-    for part in score.parts:
-        # Simple voice detection based on part name or instrument
-        part_name = getattr(part, 'partName', '').lower()
-        instrument_name = ''
-        if hasattr(part, 'getInstrument'):
-            instrument = part.getInstrument()
-            if instrument:
-                instrument_name = getattr(instrument, 'instrumentName', '').lower()
-        
-        # Check for voice indicators
-        voice_indicators = VoiceInfo.SATB_VOICES + ['s', 'a', 't', 'b']
-        for indicator in voice_indicators:
-            if indicator in part_name or indicator in instrument_name:
-                if indicator in VoiceInfo.SATB_VOICES:
-                    detected_voices.append(indicator)
-                elif indicator in ['s', 'a', 't', 'b']:
-                    voice_map = {'s': 'soprano', 'a': 'alto', 't': 'tenor', 'b': 'bass'}
-                    detected_voices.append(voice_map[indicator])
-                break
-    
-    if not detected_voices:
+    # Validate voice detection; one detected voice is enough
+    if not has_voice:
         raise VoiceDetectionError(
             "No SATB voices detected in score",
             detected_voices=[]
@@ -300,7 +337,7 @@ def validate_session_id(session_id: str) -> str:
         )
     
     # Check format (alphanumeric with some special characters)
-    if not re.match(r'^[a-zA-Z0-9_-]+$', session_id):
+    if not _SESSION_ID_RE.match(session_id):
         raise ValidationError(
             "Session ID can only contain letters, numbers, underscores, and hyphens",
             field="session_id",
@@ -310,6 +347,17 @@ def validate_session_id(session_id: str) -> str:
     return session_id
 
 
+def _size_by_seeking(file_obj: Any) -> int:
+    """Size of a file-like object by seeking to its end, or 0 if unknown."""
+    if not (hasattr(file_obj, 'seek') and hasattr(file_obj, 'tell')):
+        return 0
+    current_pos = file_obj.tell()
+    file_obj.seek(0, 2)  # Seek to end
+    file_size = file_obj.tell()
+    file_obj.seek(current_pos)  # Restore position
+    return file_size
+
+
 def validate_file_upload(file_obj: Any, max_size_mb: int = 50) -> Dict[str, Any]:
     """Validate uploaded file object.
     
@@ -355,12 +403,14 @@ def validate_file_upload(file_obj: Any, max_size_mb: int = 50) -> Dict[str, Any]
     file_size = 0
     if hasattr(file_obj, 'size'):
         file_size = file_obj.size
-    elif hasattr(file_obj, 'seek') and hasattr(file_obj, 'tell'):
-        # Try to get size by seeking to end
-        current_pos = file_obj.tell()
-        file_obj.seek(0, 2)  # Seek to end
-        file_size = file_obj.tell()
-        file_obj.seek(current_pos)  # Restore position
+    elif hasattr(file_obj, 'fileno'):
+        try:
+            # One stat call; leaves the position and buffers untouched
+            file_size = os.fstat(file_obj.fileno()).st_size
+        except OSError:
+            file_size = _size_by_seeking(file_obj)
+    else:
+        file_size = _size_by_seeking(file_obj)
     
     max_size_bytes = max_size_mb * 1024 * 1024
     if file_size > max_size_bytes:
@@ -396,6 +446,10 @@ def validate_measure_range(start_measure: int, end_measure: int,
             field="measures"
         )
     
+    # Common case: a valid range needs no further checks
+    if 1 <= start_measure <= end_measure <= total_measures:
+        return start_measure, end_measure
+    
     # Validate ranges
     if start_measure < 1:
         raise ValidationError(
@@ -429,16 +483,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove path separators
-    sanitized = filename.replace('/', '_').replace('\\', '_')
-    
-    # Remove dangerous characters
-    dangerous_chars = ['<', '>', ':', '"', '|', '?', '*']
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, '_')
-    
-    # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f]', '', sanitized)
+    # Replace path separators and dangerous characters, drop control characters
+    sanitized = filename.translate(_FILENAME_TABLE)
     
     # Ensure it's not empty
     if not sanitized:
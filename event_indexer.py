@@ -1,6 +1,9 @@
 from typing import Dict, List, Optional, Tuple
 from ikr_light import Score, Part, Voice, Measure, Event
 from fractions import Fraction
+from operator import attrgetter
+
+_onset = attrgetter('onset')
 
 
 class EventIndexer:
@@ -25,71 +28,86 @@ class EventIndexer:
             'event_hierarchy': {}
         }
         
+        parts_index = index_structure['parts']
+        events_by_part = index_structure['events_by_part']
+        events_by_voice = index_structure['events_by_voice']
+        events_by_measure = index_structure['events_by_measure']
+        event_hierarchy = index_structure['event_hierarchy']
+        event_to_id = self.event_to_id
+        id_to_event = self.id_to_event
+        next_id = self.next_id
+        
         for part in score.parts:
             part_id = f"part_{part.id}"
-            index_structure['parts'][part_id] = {
+            part_voices = {}
+            parts_index[part_id] = {
                 'name': part.name,
                 'role': part.role,
-                'voices': {}
+                'voices': part_voices
             }
-            index_structure['events_by_part'][part_id] = {}
+            part_events = events_by_part[part_id] = {}
             
             for voice in part.voices:
                 voice_id = f"voice_{voice.id}"
-                index_structure['parts'][part_id]['voices'][voice_id] = {
+                voice_measures = {}
+                part_voices[voice_id] = {
                     'voice_id': voice.id,
-                    'measures': {}
+                    'measures': voice_measures
                 }
-                index_structure['events_by_voice'][voice_id] = {}
+                # Shared by all parts with this voice number
+                voice_events = events_by_voice.setdefault(voice_id, {})
                 
                 for measure in voice.measures:
                     measure_id = f"measure_{measure.number}"
-                    index_structure['parts'][part_id]['voices'][voice_id]['measures'][measure_id] = {
+                    measure_event_ids = []
+                    voice_measures[measure_id] = {
                         'number': measure.number,
                         'time_signature': measure.time_signature,
-                        'events': []
+                        'events': measure_event_ids
                     }
-                    index_structure['events_by_measure'][measure_id] = {}
+                    # Shared by all parts and voices with this measure number
+                    measure_events = events_by_measure.setdefault(measure_id, {})
                     
                     # Sort events by onset for consistent indexing
-                    sorted_events = sorted(measure.events, key=lambda e: e.onset)
+                    sorted_events = sorted(measure.events, key=_onset)
                     
                     for event in sorted_events:
-                        event_id = f"event_{self.next_id}"
-                        self.next_id += 1
+                        event_id = f"event_{next_id}"
+                        next_id += 1
                         
-                        # Store mappings - use event string representation as key since objects aren't hashable
-                        event_key = str(event)
-                        self.event_to_id[event_key] = event_id
-                        self.id_to_event[event_id] = event
+                        # Store mappings - events are unhashable dataclasses, so key by
+                        # identity; id_to_event keeps them alive, so ids stay unique
+                        event_to_id[id(event)] = event_id
+                        id_to_event[event_id] = event
                         
                         # Add to index structure
-                        index_structure['parts'][part_id]['voices'][voice_id]['measures'][measure_id]['events'].append(event_id)
-                        index_structure['events_by_part'][part_id][event_id] = {
+                        measure_event_ids.append(event_id)
+                        part_events[event_id] = {
                             'event': event,
                             'voice_id': voice_id,
                             'measure_id': measure_id,
                             'part_id': part_id
                         }
-                        index_structure['events_by_voice'][voice_id][event_id] = {
+                        voice_events[event_id] = {
                             'event': event,
                             'measure_id': measure_id,
                             'part_id': part_id
                         }
-                        index_structure['events_by_measure'][measure_id][event_id] = {
+                        measure_events[event_id] = {
                             'event': event,
                             'voice_id': voice_id,
                             'part_id': part_id
                         }
                         
                         # Hierarchy information
-                        index_structure['event_hierarchy'][event_id] = {
+                        event_hierarchy[event_id] = {
                             'part': part_id,
                             'voice': voice_id,
                             'measure': measure_id,
                             'event_type': type(event).__name__
                         }
         
+        self.next_id = next_id
         return index_structure
     
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
@@ -97,8 +115,8 @@ class EventIndexer:
         return self.id_to_event.get(event_id)
     
     def get_event_id(self, event: Event) -> Optional[str]:
-        """Get ID for an event"""
-        return self.event_to_id.get(event)
+        """Get ID for an event (the indexed object itself, not an equal copy)"""
+        return self.event_to_id.get(id(event))
     
     def format_event_reference(self, event_id: str) -> str:
         """Format event reference for user display"""
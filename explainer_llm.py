@@ -1,10 +1,14 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from ollama_llm import OllamaLLM
 from tlr_converter import TLRConverter
 from event_indexer import EventIndexer
 from ikr_light import Score
 
 
+# Scores per cache; the app explains at most an original and a current score
+_CACHE_SIZE = 4
+
+
 class ExplainerLLM:
     """Separate LLM interface for explanation mode (read-only)"""
     
@@ -13,6 +17,12 @@ class ExplainerLLM:
         self.tlr_converter = TLRConverter()
         self.event_indexer = EventIndexer()
         
+        # Index structures and TLR texts per score, keyed by id(score).
+        # Scores are replaced, not modified, when transformed, so follow-up
+        # questions about the same score reuse these.
+        self._index_cache = {}
+        self._tlr_cache = {}
+        
         # Explanation-specific system prompt
         self.system_prompt = """You are analyzing musical transformations and explaining musical decisions.
 Rules:
@@ -38,12 +48,12 @@ If you cannot identify a specific event, ask for clarification about the event I
         """Explain transformation between original and transformed scores"""
         
         # Index both scores for event reference
-        original_index = self.event_indexer.index_score(original_score)
-        transformed_index = self.event_indexer.index_score(transformed_score)
+        original_index = self._cached_index(original_score)
+        transformed_index = self._cached_index(transformed_score)
         
         # Convert both to TLR for analysis
-        original_tlr = self.tlr_converter.ikr_to_tlr(original_score)
-        transformed_tlr = self.tlr_converter.ikr_to_tlr(transformed_score)
+        original_tlr = self._cached_tlr(original_score)
+        transformed_tlr = self._cached_tlr(transformed_score)
         
         # Build analysis prompt
         analysis_prompt = f"""Analyze this musical transformation and answer the user's question.
@@ -79,10 +89,10 @@ Please explain what happened by referencing specific event IDs and their locatio
         """Explain context within a single score"""
         
         # Index the score
-        index = self.event_indexer.index_score(score)
+        index = self._cached_index(score)
         
         # Convert to TLR
-        tlr_text = self.tlr_converter.ikr_to_tlr(score)
+        tlr_text = self._cached_tlr(score)
         
         # Build context prompt
         context_prompt = f"""Analyze this musical score and answer the user's question.
@@ -115,7 +125,7 @@ Please analyze the music and answer using specific event IDs and locations."""
     def get_event_summary(self, score: Score) -> str:
         """Get summary of all events with their IDs"""
         
-        index = self.event_indexer.index_score(score)
+        index = self._cached_index(score)
         
         summary_parts = []
         summary_parts.append("EVENT SUMMARY:")
@@ -140,4 +150,24 @@ Please analyze the music and answer using specific event IDs and locations."""
                         event_type = event_info['event_type']
                         summary_parts.append(f"      {event_id}: {event_type}")
         
-        return "\n".join(summary_parts)
\ No newline at end of file
+        return "\n".join(summary_parts)
+    
+    def _cached_index(self, score: Score) -> Dict:
+        """Event index of a score, computed once per score object"""
+        return self._cached(self._index_cache, score, self.event_indexer.index_score)
+    
+    def _cached_tlr(self, score: Score) -> str:
+        """TLR text of a score, computed once per score object"""
+        return self._cached(self._tlr_cache, score, self.tlr_converter.ikr_to_tlr)
+    
+    @staticmethod
+    def _cached(cache: Dict, score: Score, compute: Callable):
+        """Look up or compute a per-score result in one of the caches"""
+        entry = cache.get(id(score))
+        # The entry keeps its score alive, so its id cannot be reused by
+        # another score while it is cached
+        if entry is None or entry[0] is not score:
+            if len(cache) >= _CACHE_SIZE:
+                del cache[next(iter(cache))]
+            entry = cache[id(score)] = (score, compute(score))
+        return entry[1]
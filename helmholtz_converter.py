@@ -1,5 +1,27 @@
 from typing import Dict, List, Tuple, Optional
 from ikr_light import Score, Part, Voice, Measure, NoteEvent, RestEvent, HarmonyEvent, LyricEvent
+from fractions import Fraction
+from operator import attrgetter
+
+
+# Sort keys; the lists are sorted on every pass, and timsort is linear
+# for lists that are already in order
+_by_name = attrgetter('name')
+_by_id = attrgetter('id')
+_by_number = attrgetter('number')
+_by_onset = attrgetter('onset')
+
+# Readable names of common durations
+_DURATION_NAMES = {
+    Fraction(1, 4): "quarter",
+    Fraction(1, 2): "half",
+    Fraction(1, 1): "whole",
+    Fraction(1, 8): "eighth",
+    Fraction(1, 16): "sixteenth",
+    Fraction(3, 4): "dotted half",
+    Fraction(3, 8): "dotted quarter",
+    Fraction(3, 16): "dotted eighth",
+}
 
 
 class HelmholtzConverter:
@@ -21,14 +43,38 @@ class HelmholtzConverter:
         # For English B, we need to handle carefully
         # In Helmholtz: B-flat = 'b', B-natural = 'h' (German), 
         # But we'll use English convention: B-flat = '♭', B-natural = 'b'
+        
+        # Precomputed pitch text per (step, octave, alter), so converting a
+        # note is a single lookup; other combinations are computed directly
+        self._pitch_table = {
+            (step, octave, alter): self._pitch_to_helmholtz(step, octave, alter)
+            for step in self.spn_to_helmholtz
+            for octave in range(9)
+            for alter in range(-2, 3)
+        }
     
     def note_to_helmholtz(self, note_event: NoteEvent) -> str:
         """Convert a single note event to Helmholtz notation"""
-        base_note = note_event.pitch_step
+        key = (note_event.pitch_step, note_event.octave, note_event.pitch_alter)
+        helmholtz_pitch = self._pitch_table.get(key)
+        if helmholtz_pitch is None:
+            helmholtz_pitch = self._pitch_to_helmholtz(*key)
         
+        # Add tie information
+        tie_suffix = ""
+        if note_event.tie:
+            if note_event.tie == "start":
+                tie_suffix = "～"
+            elif note_event.tie == "stop":
+                tie_suffix = "～"
+        
+        return helmholtz_pitch + tie_suffix
+    
+    def _pitch_to_helmholtz(self, base_note: str, octave: int, pitch_alter) -> str:
+        """Helmholtz text for a pitch, including accidentals"""
         # Handle B special case (English B = German H, B-flat = German B)
         if base_note == 'B':
-            if note_event.pitch_alter == -1:  # B-flat
+            if pitch_alter == -1:  # B-flat
                 # In Helmholtz, B-flat is 'b' (lowercase)
                 helmholtz_base = 'b'
             else:
@@ -37,77 +83,49 @@ class HelmholtzConverter:
                 helmholtz_base = 'b♮'
         else:
             # Get base Helmholtz note
-            helmholtz_base = self.spn_to_helmholtz.get(base_note, {}).get(note_event.octave, base_note.lower())
+            helmholtz_base = self.spn_to_helmholtz.get(base_note, {}).get(octave, base_note.lower())
         
         # Add accidentals
-        if note_event.pitch_alter == 1:
+        if pitch_alter == 1:
             helmholtz_base += '♯'
-        elif note_event.pitch_alter == -1:
+        elif pitch_alter == -1:
             if base_note != 'B':  # B-flat already handled
                 helmholtz_base += '♭'
-        elif note_event.pitch_alter == 2:
+        elif pitch_alter == 2:
             helmholtz_base += '𝄪'
-        elif note_event.pitch_alter == -2:
+        elif pitch_alter == -2:
             helmholtz_base += '𝄫'
         
-        # Add tie information
-        tie_suffix = ""
-        if note_event.tie:
-            if note_event.tie == "start":
-                tie_suffix = "～"
-            elif note_event.tie == "stop":
-                tie_suffix = "～"
-        
-        return helmholtz_base + tie_suffix
+        return helmholtz_base
     
     def duration_to_helmholtz_text(self, duration) -> str:
         """Convert duration fraction to readable text"""
-        # Convert to simplified fraction for display
-        from fractions import Fraction
-        
-        if duration == Fraction(1, 4):
-            return "quarter"
-        elif duration == Fraction(1, 2):
-            return "half"
-        elif duration == Fraction(1, 1):
-            return "whole"
-        elif duration == Fraction(1, 8):
-            return "eighth"
-        elif duration == Fraction(1, 16):
-            return "sixteenth"
-        elif duration == Fraction(3, 4):
-            return "dotted half"
-        elif duration == Fraction(3, 8):
-            return "dotted quarter"
-        elif duration == Fraction(3, 16):
-            return "dotted eighth"
-        else:
-            return str(duration)
+        return _DURATION_NAMES.get(duration, str(duration))
     
     def score_to_helmholtz_tlr(self, score: Score) -> str:
         """Convert IKR score to TLR format with Helmholtz notation"""
         lines = []
         
         # Sort parts by name for deterministic output
-        sorted_parts = sorted(score.parts, key=lambda p: p.name)
+        sorted_parts = sorted(score.parts, key=_by_name)
         
         for part in sorted_parts:
             lines.append(f"PART {part.name} ROLE {part.role}")
             
             # Sort voices by ID for deterministic output
-            sorted_voices = sorted(part.voices, key=lambda v: v.id)
+            sorted_voices = sorted(part.voices, key=_by_id)
             
             for voice in sorted_voices:
                 lines.append(f"VOICE {voice.id}")
                 
                 # Sort measures by number for deterministic output
-                sorted_measures = sorted(voice.measures, key=lambda m: m.number)
+                sorted_measures = sorted(voice.measures, key=_by_number)
                 
                 for measure in sorted_measures:
                     lines.append(f"MEASURE {measure.number} TIME {measure.time_signature}")
                     
                     # Sort events by onset for deterministic output
-                    sorted_events = sorted(measure.events, key=lambda e: e.onset)
+                    sorted_events = sorted(measure.events, key=_by_onset)
                     
                     for event in sorted_events:
                         line = self._event_to_helmholtz_tlr(event)
@@ -120,22 +138,44 @@ class HelmholtzConverter:
     
     def _event_to_helmholtz_tlr(self, event) -> str:
         """Convert single event to TLR line with Helmholtz notation"""
-        if isinstance(event, NoteEvent):
-            helmholtz_note = self.note_to_helmholtz(event)
-            duration_text = self.duration_to_helmholtz_text(event.duration)
-            return f"NOTE t={event.onset} dur={event.duration} pitch={helmholtz_note} ({duration_text})"
-        
-        elif isinstance(event, RestEvent):
-            duration_text = self.duration_to_helmholtz_text(event.duration)
-            return f"REST t={event.onset} dur={event.duration} ({duration_text})"
-        
-        elif isinstance(event, HarmonyEvent):
-            return f"HARMONY t={event.onset} symbol={event.harmony}"
-        
-        elif isinstance(event, LyricEvent):
-            return f"LYRIC t={event.onset} text={event.text}"
-        
-        return ""
+        # Dispatch on the exact event type; subclasses use their base's formatter
+        formatter = self._EVENT_FORMATTERS.get(type(event))
+        if formatter is None:
+            formatter = self._inherited_formatter(type(event))
+            if formatter is None:
+                return ""
+        return formatter(self, event)
+    
+    @classmethod
+    def _inherited_formatter(cls, event_type: type):
+        """Formatter of the nearest base class of an event type, if any"""
+        for base in event_type.__mro__[1:]:
+            formatter = cls._EVENT_FORMATTERS.get(base)
+            if formatter is not None:
+                return formatter
+        return None
+    
+    def _note_to_helmholtz_tlr(self, event: NoteEvent) -> str:
+        helmholtz_note = self.note_to_helmholtz(event)
+        duration_text = self.duration_to_helmholtz_text(event.duration)
+        return f"NOTE t={event.onset} dur={event.duration} pitch={helmholtz_note} ({duration_text})"
+    
+    def _rest_to_helmholtz_tlr(self, event: RestEvent) -> str:
+        duration_text = self.duration_to_helmholtz_text(event.duration)
+        return f"REST t={event.onset} dur={event.duration} ({duration_text})"
+    
+    def _harmony_to_helmholtz_tlr(self, event: HarmonyEvent) -> str:
+        return f"HARMONY t={event.onset} symbol={event.harmony}"
+    
+    def _lyric_to_helmholtz_tlr(self, event: LyricEvent) -> str:
+        return f"LYRIC t={event.onset} text={event.text}"
+    
+    _EVENT_FORMATTERS = {
+        NoteEvent: _note_to_helmholtz_tlr,
+        RestEvent: _rest_to_helmholtz_tlr,
+        HarmonyEvent: _harmony_to_helmholtz_tlr,
+        LyricEvent: _lyric_to_helmholtz_tlr,
+    }
     
     def get_dual_notation_display(self, score: Score) -> Dict[str, str]:
         """Get both SPN and Helmholtz notation displays"""
@@ -2,6 +2,11 @@ from music21 import stream, note, harmony, metadata, instrument
 from fractions import Fraction
 from typing import Dict, List, Optional, Any
 from ikr_light import Score, Part, Voice, Measure, Event, NoteEvent, RestEvent, HarmonyEvent, LyricEvent
+from operator import attrgetter
+
+
+# Sort key for measure events
+_by_onset = attrgetter('onset')
 
 
 class MusicXMLExporter:
@@ -77,12 +82,12 @@ class MusicXMLExporter:
         for measure in voice.measures:
             measures_dict[measure.number] = measure
         
-        # Create measures in order
+        # Create measures in order and append them in one call
         if measures_dict:
-            for measure_num in sorted(measures_dict.keys()):
-                measure = measures_dict[measure_num]
-                m21_measure = self._create_measure(measure, voice.id)
-                m21_part.append(m21_measure)
+            m21_part.append([
+                self._create_measure(measures_dict[measure_num], voice.id)
+                for measure_num in sorted(measures_dict.keys())
+            ])
     
     def _create_measure(self, ikr_measure: Measure, voice_id: str) -> stream.Measure:
         """Create music21 Measure from IKR-light Measure"""
@@ -93,13 +98,16 @@ class MusicXMLExporter:
         self._add_time_signature(m21_measure, ikr_measure.time_signature)
         
         # Sort events by onset
-        sorted_events = sorted(ikr_measure.events, key=lambda e: e.onset)
+        sorted_events = sorted(ikr_measure.events, key=_by_onset)
         
-        # Add events to measure
+        # Add events to measure; the stream is updated once at the end
+        # instead of after every insert
         for event in sorted_events:
             m21_element = self._create_m21_element(event, voice_id)
             if m21_element:
-                m21_measure.insert(float(event.onset), m21_element)
+                m21_measure.coreGuardBeforeAddElement(m21_element)
+                m21_measure.coreInsert(float(event.onset), m21_element)
+        m21_measure.coreElementsChanged()
         
         return m21_measure
     
@@ -121,15 +129,14 @@ class MusicXMLExporter:
     
     def _create_m21_element(self, event: Event, voice_id: str):
         """Create music21 element from IKR-light Event"""
+        # Lyrics are attached to notes, not standalone, so a LyricEvent
+        # creates no element
         if isinstance(event, NoteEvent):
             return self._create_note(event, voice_id)
         elif isinstance(event, RestEvent):
             return self._create_rest(event, voice_id)
         elif isinstance(event, HarmonyEvent):
             return self._create_harmony(event)
-        elif isinstance(event, LyricEvent):
-            # Lyrics are attached to notes, not standalone
-            return None
         
         return None
     
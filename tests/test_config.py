@@ -0,0 +1,105 @@
+import os
+import stat
+
+import pytest
+
+from core.config import ConfigManager
+from core.exceptions import ConfigurationError
+
+
+class TestConfigManager:
+    """Test loading and saving configuration files"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.yaml_text = "audio:\n  sample_rate: 48000\nui:\n  theme: dark\n"
+    
+    def _load(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(self.yaml_text, encoding="utf-8")
+        return ConfigManager(config_file).get_config()
+    
+    def test_loaded_configs_do_not_share_mutable_fields(self, tmp_path):
+        """Mutating one loaded config leaves later loads untouched"""
+        first = self._load(tmp_path)
+        expected_tunings = list(first.audio.tuning_options)
+        expected_ranges = {voice: dict(r) for voice, r in first.audio.voice_ranges.items()}
+        expected_prompts = dict(first.llm.voice_prompts)
+        
+        first.audio.tuning_options.append(999.0)
+        for voice_range in first.audio.voice_ranges.values():
+            voice_range["min"] = 0
+        first.audio.voice_ranges["extra"] = {"min": 1, "max": 2}
+        first.llm.voice_prompts.clear()
+        
+        second = self._load(tmp_path)
+        assert second.audio.tuning_options == expected_tunings
+        assert second.audio.voice_ranges == expected_ranges
+        assert second.llm.voice_prompts == expected_prompts
+    
+    def test_save_keeps_existing_file_mode(self, tmp_path):
+        """Saving over an existing file keeps its permission bits"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(self.yaml_text, encoding="utf-8")
+        os.chmod(config_file, 0o640)
+        
+        ConfigManager(config_file).save_config()
+        
+        assert stat.S_IMODE(os.stat(config_file).st_mode) == 0o640
+    
+    def test_save_new_file_uses_umask(self, tmp_path):
+        """A new file gets the umask-adjusted mode, not mkstemp's 0600"""
+        config_file = tmp_path / "new" / "config.yaml"
+        old_umask = os.umask(0o022)
+        try:
+            ConfigManager(config_file).save_config()
+        finally:
+            os.umask(old_umask)
+        
+        assert stat.S_IMODE(os.stat(config_file).st_mode) == 0o644
+    
+    @pytest.mark.parametrize("target", ["builtins.open", "yaml.dump", "os.replace"])
+    def test_failed_save_cleans_up(self, tmp_path, monkeypatch, target):
+        """A failed save closes the temp file, removes it and keeps the old file"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(self.yaml_text, encoding="utf-8")
+        manager = ConfigManager(config_file)
+        
+        closed = []
+        real_close = os.close
+        monkeypatch.setattr(os, "close", lambda fd: (closed.append(fd), real_close(fd)))
+        
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(target, fail)
+        
+        with pytest.raises(ConfigurationError):
+            manager.save_config()
+        
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.yaml"]
+        assert config_file.read_text(encoding="utf-8") == self.yaml_text
+        if target == "builtins.open":
+            assert len(closed) == 1
+    
+    @pytest.mark.parametrize("key", ["_PATH_FIELDS", "_to_dict", "no_such_field"])
+    def test_update_rejects_unknown_section_fields(self, tmp_path, key):
+        """Non-field attributes and unknown keys raise ConfigurationError"""
+        manager = ConfigManager(tmp_path / "config.yaml")
+        before = manager.get_config().paths
+        
+        with pytest.raises(ConfigurationError) as excinfo:
+            manager.update_config(paths={key: None})
+        
+        assert excinfo.value.config_key == f"paths.{key}"
+        assert manager.get_config().paths is before
+    
+    def test_update_rebuilds_section(self, tmp_path):
+        """Known fields are applied to a new, validated section"""
+        manager = ConfigManager(tmp_path / "config.yaml")
+        
+        manager.update_config(llm={"temperature": 0.5})
+        assert manager.get_config().llm.temperature == 0.5
+        
+        with pytest.raises(ConfigurationError):
+            manager.update_config(llm={"temperature": 5.0})
+        assert manager.get_config().llm.temperature == 0.5
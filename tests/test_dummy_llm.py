@@ -0,0 +1,29 @@
+from core.editor.dummy_llm import DummyLLM
+from core.editor.ollama import OllamaDummyLLM
+
+
+class TestDummyLLMResults:
+    """Test that dummy LLM results are fresh plain dicts"""
+    
+    def test_harmonize_prompt_returns_fresh_dict(self):
+        """Each call returns its own dict, which prints like one"""
+        llm = DummyLLM()
+        first = llm.harmonize_prompt("C major", "S")
+        assert type(first) is dict
+        assert str(first) == "{'measure': 1, 'root': 'C', 'quality': 'major'}"
+        
+        first["root"] = "F"
+        assert llm.harmonize_prompt("C major", "S")["root"] == "C"
+    
+    def test_ollama_dummy_returns_fresh_dicts(self):
+        """Per-voice results are plain dicts not shared between calls"""
+        llm = OllamaDummyLLM("dummy")
+        first = llm.harmonize_prompt("C major")
+        assert type(first) is dict
+        assert all(type(result) is dict for result in first.values())
+        
+        first["A"]["root"] = "D"
+        del first["B"]
+        second = llm.harmonize_prompt("C major")
+        assert second["A"]["root"] == "G"
+        assert set(second) == {"S", "A", "T", "B"}
@@ -0,0 +1,40 @@
+import pytest
+
+from core.editor.ghost import GhostChord, GhostLayer
+
+
+class TestGhostLayer:
+    """Test access to and removal of ghost chords"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.ghosts = [GhostChord(1, "C"), GhostChord(2, "A", "minor"), GhostChord(1, "C")]
+        self.layer = GhostLayer()
+        for ghost in self.ghosts:
+            self.layer.add(ghost)
+    
+    def test_chords_cannot_be_mutated(self):
+        """chords is read-only, so list-style removal fails loudly"""
+        chords = self.layer.chords
+        assert chords == tuple(self.ghosts)
+        with pytest.raises(AttributeError):
+            chords.pop(0)
+        with pytest.raises(AttributeError):
+            chords.remove(self.ghosts[0])
+        assert len(self.layer) == 3
+    
+    def test_index_lookup(self):
+        """Ghosts are indexed in insertion order, including from the end"""
+        assert [self.layer[i] for i in range(3)] == self.ghosts
+        assert self.layer[1] is self.ghosts[1]
+        assert self.layer[-1] is self.ghosts[2]
+        for index in (3, -4):
+            with pytest.raises(IndexError):
+                self.layer[index]
+    
+    def test_pop_and_discard(self):
+        """Equal ghosts are still removed one object at a time"""
+        assert self.layer.pop(0) is self.ghosts[0]
+        self.layer.discard(self.ghosts[1])
+        assert self.layer.chords == (self.ghosts[2],)
+        assert self.layer.list_labels() == ["Takt 1: C major"]
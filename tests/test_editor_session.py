@@ -0,0 +1,167 @@
+import pytest
+from music21 import chord, stream
+
+from core.editor.session import EditorSession, ScoreDelta
+from core.score.reharmonize import replace_chord_in_measure
+
+
+def _score(measures=3):
+    """Two-part score with a C major chord in every measure"""
+    score = stream.Score()
+    for _ in range(2):
+        part = stream.Part()
+        for number in range(1, measures + 1):
+            measure = stream.Measure(number=number)
+            measure.append(chord.Chord(['C4', 'E4', 'G4'], quarterLength=4))
+            part.append(measure)
+        score.insert(0, part)
+    return score
+
+
+def _chords(score):
+    """Chord pitch names per part and measure"""
+    return [
+        [tuple(c.pitchNames) for c in part.recurse().getElementsByClass(chord.Chord)]
+        for part in score.parts
+    ]
+
+
+C, A_MINOR, F, G = ('C', 'E', 'G'), ('A', 'C', 'E'), ('F', 'A', 'C'), ('G', 'B', 'D')
+
+
+class TestEditorSession:
+    """Test undo/redo of snapshots and deltas in EditorSession"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.score = _score()
+        self.session = EditorSession(self.score)
+    
+    def _state(self):
+        return _chords(self.session.current_score)
+    
+    def test_undo_redo_after_deltas(self):
+        """replace_chord edits can be undone and redone one by one"""
+        self.session.replace_chord(1, 'A', 'minor')
+        self.session.replace_chord(2, 'F')
+        assert isinstance(self.session.history[-1], ScoreDelta)
+        assert self._state() == [[A_MINOR, F, C]] * 2
+        
+        assert self.session.undo()
+        assert self._state() == [[A_MINOR, C, C]] * 2
+        assert self.session.undo()
+        assert self._state() == [[C, C, C]] * 2
+        assert not self.session.undo()
+        
+        assert self.session.redo()
+        assert self._state() == [[A_MINOR, C, C]] * 2
+        assert self.session.redo()
+        assert self._state() == [[A_MINOR, F, C]] * 2
+        assert not self.session.redo()
+        # The loaded score is a snapshot and is never edited in place
+        assert _chords(self.score) == [[C, C, C]] * 2
+    
+    def test_undo_redo_after_snapshots(self):
+        """mutate and apply_edit record snapshots that undo and redo restore"""
+        with self.session.mutate() as score:
+            replace_chord_in_measure(score, 1, 'G')
+        edited = _score()
+        replace_chord_in_measure(edited, 3, 'F')
+        self.session.apply_edit(edited)
+        
+        assert self.session.undo()
+        assert self._state() == [[G, C, C]] * 2
+        assert self.session.undo()
+        assert self.session.current_score is self.score
+        assert self.session.redo()
+        assert self._state() == [[G, C, C]] * 2
+        assert self.session.redo()
+        assert self.session.current_score is edited
+        assert _chords(self.score) == [[C, C, C]] * 2
+    
+    def test_deltas_on_top_of_snapshot(self):
+        """Undoing deltas after a snapshot returns to the untouched snapshot"""
+        with self.session.mutate() as score:
+            replace_chord_in_measure(score, 3, 'G')
+        snapshot = self.session.current_score
+        self.session.replace_chord(1, 'F')
+        self.session.replace_chord(1, 'A', 'minor')
+        
+        assert self.session.undo()
+        assert self._state() == [[F, C, G]] * 2
+        assert self.session.undo()
+        assert self.session.current_score is snapshot
+        assert self._state() == [[C, C, G]] * 2
+        assert self.session.redo()
+        assert self.session.redo()
+        assert self._state() == [[A_MINOR, C, G]] * 2
+        assert _chords(snapshot) == [[C, C, G]] * 2
+    
+    def test_oldest_steps_are_evicted(self):
+        """Only the last max_undo_steps changes can be undone"""
+        session = EditorSession(self.score, max_undo_steps=2)
+        session.replace_chord(1, 'F')
+        session.replace_chord(2, 'G')
+        session.replace_chord(3, 'A', 'minor')
+        
+        assert len(session.history) == 3
+        assert session.undo()
+        assert session.undo()
+        assert not session.undo()
+        assert _chords(session.current_score) == [[F, C, C]] * 2
+        
+        assert session.redo()
+        assert session.redo()
+        assert _chords(session.current_score) == [[F, G, A_MINOR]] * 2
+    
+    @pytest.mark.parametrize("snapshot", [False, True])
+    def test_new_edit_clears_redo(self, snapshot):
+        """An edit after undo discards the undone changes"""
+        self.session.replace_chord(1, 'F')
+        self.session.replace_chord(2, 'G')
+        assert self.session.undo()
+        
+        if snapshot:
+            with self.session.mutate() as score:
+                replace_chord_in_measure(score, 3, 'A', 'minor')
+        else:
+            self.session.replace_chord(3, 'A', 'minor')
+        
+        assert not self.session.future
+        assert not self.session.redo()
+        assert self._state() == [[F, C, A_MINOR]] * 2
+        assert self.session.undo()
+        assert self._state() == [[F, C, C]] * 2
+    
+    def test_mutate_restores_state_on_exception(self):
+        """A failing mutate block leaves the session as it was"""
+        self.session.replace_chord(1, 'F')
+        before = self.session.current_score
+        history = list(self.session.history)
+        
+        with pytest.raises(RuntimeError):
+            with self.session.mutate() as score:
+                replace_chord_in_measure(score, 2, 'G')
+                raise RuntimeError("edit failed")
+        
+        assert self.session.current_score is before
+        assert list(self.session.history) == history
+        assert self._state() == [[F, C, C]] * 2
+        
+        # The restored score is still edited as a delta, and undo works
+        self.session.replace_chord(3, 'G')
+        assert self.session.undo()
+        assert self.session.undo()
+        assert self.session.current_score is self.score
+        assert _chords(self.score) == [[C, C, C]] * 2
+    
+    def test_mutate_on_snapshot_failure_keeps_snapshot_shared(self):
+        """After a failed mutate on a snapshot, later edits still copy it"""
+        with pytest.raises(ValueError):
+            with self.session.mutate() as score:
+                replace_chord_in_measure(score, 9, 'G')
+        
+        assert self.session.current_score is self.score
+        self.session.replace_chord(1, 'G')
+        assert _chords(self.score) == [[C, C, C]] * 2
+        assert self._state() == [[G, C, C]] * 2
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Optional
+
+from music21 import note
+
+from helmholtz_converter import HelmholtzConverter
+from ikr_light import NoteEvent, RestEvent
+from musicxml_exporter import MusicXMLExporter
+from tlr_converter import TLRConverter
+
+
+@dataclass
+class VoicedNoteEvent(NoteEvent):
+    """NoteEvent subclass, as a caller might add extra fields"""
+    voice: Optional[str] = None
+
+
+class LabelledRestEvent(RestEvent):
+    """RestEvent subclass without extra fields"""
+
+
+def _note(cls=NoteEvent):
+    return cls(onset=Fraction(0), duration=Fraction(1, 4),
+               pitch_step='F', pitch_alter=1, octave=4)
+
+
+class TestEventSubclassDispatch:
+    """Subclasses of event types convert like their base type"""
+    
+    def test_tlr_converter(self):
+        """TLR lines of subclass events equal those of the base events"""
+        converter = TLRConverter()
+        assert converter._event_to_tlr(_note(VoicedNoteEvent)) == converter._event_to_tlr(_note())
+        rest = LabelledRestEvent(onset=Fraction(1, 4), duration=Fraction(1, 2))
+        assert converter._event_to_tlr(rest) == "REST t=1/4 dur=1/2"
+    
+    def test_helmholtz_converter(self):
+        """Helmholtz lines of subclass events equal those of the base events"""
+        converter = HelmholtzConverter()
+        assert (converter._event_to_helmholtz_tlr(_note(VoicedNoteEvent))
+                == converter._event_to_helmholtz_tlr(_note()))
+        rest = LabelledRestEvent(onset=Fraction(0), duration=Fraction(1, 2))
+        assert converter._event_to_helmholtz_tlr(rest).startswith("REST t=0 dur=1/2")
+    
+    def test_musicxml_exporter(self):
+        """Subclass events still produce music21 elements"""
+        exporter = MusicXMLExporter()
+        element = exporter._create_m21_element(_note(VoicedNoteEvent), "1")
+        assert isinstance(element, note.Note)
+        assert element.nameWithOctave == 'F#4'
+        rest = LabelledRestEvent(onset=Fraction(0), duration=Fraction(1, 2))
+        assert isinstance(exporter._create_m21_element(rest, "1"), note.Rest)
+    
+    def test_unrelated_types_are_skipped(self):
+        """Objects that are no event type produce no output"""
+        assert TLRConverter()._event_to_tlr(object()) is None
+        assert HelmholtzConverter()._event_to_helmholtz_tlr(object()) == ""
+        assert MusicXMLExporter()._create_m21_element(object(), "1") is None
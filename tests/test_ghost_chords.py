@@ -6,7 +6,7 @@ Mini-Testscript für Ghost Chords (Schritt 13)
 - prüft Session-Management
 """
 
-from core.score import load_musicxml, replace_chord_in_measure
+from core.score import load_musicxml
 from core.editor.session import EditorSession
 from core.llm.ghost_generator import generate_ghost_chords
 
@@ -27,15 +27,12 @@ def main():
 
     # 3️⃣ Accept Ghost Takt 1
     ghost_to_accept = session.ghosts.chords[0]
-    replace_chord_in_measure(session.current_score, ghost_to_accept.measure, ghost_to_accept.root)
-    session.apply(session.current_score)
-    session.ghosts.chords.pop(0)
+    session.accept_ghost(ghost_to_accept)
     print(f"Ghost akzeptiert: {ghost_to_accept.label()}")
 
     # 4️⃣ Reject Ghost Takt 2
     if len(session.ghosts.chords) > 0:
-        ghost_to_reject = session.ghosts.chords[0]
-        session.ghosts.chords.pop(0)
+        ghost_to_reject = session.ghosts.pop(0)
         print(f"Ghost verworfen: {ghost_to_reject.label()}")
 
     # 5️⃣ Final-Status prüfen
@@ -0,0 +1,54 @@
+from music21 import chord, stream
+
+from core.editor.session import EditorSession
+from core.llm.ghost_generator import generate_ghost_chords
+
+
+def _score():
+    """One part with a C major chord in each of two measures"""
+    part = stream.Part()
+    for number in (1, 2):
+        measure = stream.Measure(number=number)
+        measure.append(chord.Chord(['C4', 'E4', 'G4'], quarterLength=4))
+        part.append(measure)
+    score = stream.Score()
+    score.insert(0, part)
+    return score
+
+
+class TestGenerateGhostChords:
+    """Test the rule-based ghost chord suggestions"""
+    
+    def test_romantic_prompt(self):
+        """The keyword yields A minor and F major, matched case-insensitively"""
+        ghosts = generate_ghost_chords("Make it ROMANTIC, really romantic")
+        assert [(g.measure, g.root, g.quality) for g in ghosts] == [
+            (1, "A", "minor"),
+            (2, "F", "major"),
+        ]
+        assert [g.label() for g in ghosts] == ["Takt 1: A minor", "Takt 2: F major"]
+    
+    def test_no_keyword(self):
+        """Prompts without a keyword yield no ghosts"""
+        assert generate_ghost_chords("baroque chorale") == []
+    
+    def test_fresh_ghosts_per_call(self):
+        """Each call returns new ghost objects"""
+        first, second = generate_ghost_chords("romantic"), generate_ghost_chords("romantic")
+        assert first == second
+        assert not {id(g) for g in first} & {id(g) for g in second}
+    
+    def test_accepted_ghosts_insert_their_chords(self):
+        """Accepting the generated ghosts puts A minor and F major in the score"""
+        session = EditorSession(_score())
+        for ghost in generate_ghost_chords("romantic"):
+            session.ghosts.add(ghost)
+        for ghost in session.ghosts.chords:
+            session.accept_ghost(ghost)
+        
+        assert len(session.ghosts) == 0
+        names = [
+            c.pitchedCommonName
+            for c in session.current_score.recurse().getElementsByClass(chord.Chord)
+        ]
+        assert names == ["A-minor triad", "F-major triad"]
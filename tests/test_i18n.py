@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from core.i18n import FALLBACK_FILE_NAME, LEGACY_FALLBACK_FILE_NAME, I18nManager
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+class TestI18nManager:
+    """Test fallback translation files and locale discovery"""
+    
+    def test_legacy_fallback_file_is_still_read(self, tmp_path):
+        """Customized texts in the legacy file override the per-locale files"""
+        _write_json(tmp_path / "en" / FALLBACK_FILE_NAME,
+                    {"ui.undo": "Undo", "ui.redo": "Redo"})
+        _write_json(tmp_path / LEGACY_FALLBACK_FILE_NAME,
+                    {"en": {"ui.undo": "Step back"}, "fr": {"ui.undo": "Annuler"}})
+        manager = I18nManager(locale_dir=tmp_path)
+        
+        with pytest.warns(DeprecationWarning):
+            assert manager.get_text("ui.undo") == "Step back"
+        assert manager.get_text("ui.redo") == "Redo"
+        
+        manager.set_locale("fr")
+        assert manager.current_locale == "fr"
+        assert manager.get_text("ui.undo") == "Annuler"
+        assert manager.get_text("ui.redo") == "Redo"
+    
+    def test_available_locales_come_from_directories(self, tmp_path):
+        """Listing locales does not load any fallback translations"""
+        _write_json(tmp_path / "en" / FALLBACK_FILE_NAME, {"ui.undo": "Undo"})
+        (tmp_path / "de").mkdir()
+        (tmp_path / "de" / FALLBACK_FILE_NAME).write_text("not json", encoding='utf-8')
+        (tmp_path / "README.txt").write_text("", encoding='utf-8')
+        manager = I18nManager(locale_dir=tmp_path)
+        
+        (tmp_path / "it").mkdir()
+        assert manager.get_available_locales() == ["de", "en", "it"]
+        assert manager.fallback_translations == {}
+    
+    def test_available_locales_include_legacy_file(self, tmp_path):
+        """Locales only found in the legacy file are listed too"""
+        (tmp_path / "en").mkdir()
+        _write_json(tmp_path / LEGACY_FALLBACK_FILE_NAME, {"fr": {"ui.undo": "Annuler"}})
+        manager = I18nManager(locale_dir=tmp_path)
+        
+        with pytest.warns(DeprecationWarning):
+            assert manager.get_available_locales() == ["en", "fr"]
+        assert manager.fallback_translations == {}
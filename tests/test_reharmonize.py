@@ -0,0 +1,26 @@
+from core.score.reharmonize import make_chord
+
+
+class TestMakeChord:
+    """Test chord construction in make_chord"""
+    
+    def test_chords_share_no_pitch_state(self):
+        """Chords built from the cache have their own pitches and accidentals"""
+        first = make_chord('F#', 'major')
+        second = make_chord('F#', 'major')
+        assert [p.nameWithOctave for p in first.pitches] == ['F#4', 'B-4', 'C#5']
+        
+        first_objects = {id(p) for p in first.pitches}
+        first_objects.update(id(p.accidental) for p in first.pitches if p.accidental)
+        second_objects = {id(p) for p in second.pitches}
+        second_objects.update(id(p.accidental) for p in second.pitches if p.accidental)
+        assert not first_objects & second_objects
+        
+        first.pitches[0].accidental.displayStatus = True
+        assert second.pitches[0].accidental.displayStatus is None
+        assert make_chord('F#', 'major').pitches[0].accidental.displayStatus is None
+    
+    def test_quality_is_case_insensitive(self):
+        """Quality names are matched regardless of case"""
+        assert ([p.nameWithOctave for p in make_chord('A', 'Minor').pitches]
+                == ['A4', 'C5', 'E5'])
@@ -0,0 +1,99 @@
+import pytest
+from music21 import chord, harmony, stream
+
+from core.score.harmony import _simple_figure, analyze_chords
+
+
+def _score_with_chords(voicings):
+    """Score with one chord per measure"""
+    part = stream.Part()
+    for number, pitches in enumerate(voicings, start=1):
+        measure = stream.Measure(number=number)
+        measure.append(chord.Chord(pitches))
+        part.append(measure)
+    score = stream.Score()
+    score.insert(0, part)
+    return score
+
+
+def _describe(cs):
+    return cs.figure, [p.nameWithOctave for p in cs.pitches]
+
+
+class TestAnalyzeChords:
+    """Test chord analysis against music21's chordSymbolFromChord"""
+    
+    def test_same_chord_in_different_octaves(self):
+        """Repeated chords keep their own pitches, octaves and doublings"""
+        voicings = [
+            ['E-4', 'G4', 'B-4'],
+            ['E-3', 'B-3', 'G4', 'E-5'],
+            ['G2', 'E-4', 'B-5'],
+            ['E-4', 'E-3'],
+            ['E-5', 'E-2'],
+            ['C3', 'G3', 'E4', 'B-4'],
+            ['C4', 'E4', 'G4', 'B-5', 'C5'],
+        ]
+        score = _score_with_chords(voicings)
+        
+        expected = [_describe(harmony.chordSymbolFromChord(chord.Chord(v))) for v in voicings]
+        
+        assert [_describe(cs) for cs in analyze_chords(score)] == expected
+        # A second, incremental analysis gives the same result
+        assert [_describe(cs) for cs in analyze_chords(score)] == expected
+    
+    def test_figure_depends_on_voicing(self):
+        """Voicings with the same bass and pitch names are analyzed separately"""
+        voicings = [['A-2', 'A#2', 'D#2'], ['D#2', 'A#5', 'A-2']]
+        score = _score_with_chords(voicings)
+        
+        expected = [harmony.chordSymbolFigureFromChord(chord.Chord(v)) for v in voicings]
+        
+        assert [cs.figure for cs in analyze_chords(score)] == expected
+    
+    def test_octave_change_is_reanalyzed(self):
+        """A chord moved to another octave gets a symbol with the new pitches"""
+        score = _score_with_chords([['C4', 'E4', 'G4']])
+        analyze_chords(score)
+        
+        c = score.recurse().getElementsByClass(chord.Chord).first()
+        c.pitches = chord.Chord(['C3', 'E3', 'G3']).pitches
+        
+        [cs] = analyze_chords(score)
+        assert [p.nameWithOctave for p in cs.pitches] == ['C3', 'E3', 'G3']
+    
+    def test_symbols_are_independent_copies(self):
+        """Symbols of equal chords are separate objects"""
+        score = _score_with_chords([['C4', 'E4', 'G4'], ['C4', 'E4', 'G4']])
+        first, second = analyze_chords(score)
+        assert first is not second
+
+    @pytest.mark.parametrize("pitches", [
+        ['C4', 'E4', 'G4'],
+        ['E3', 'G4', 'C5'],
+        ['A3', 'C4', 'E4', 'A4'],
+        ['B3', 'D4', 'F4'],
+        ['G2', 'B3', 'D4', 'F4'],
+        ['E-3', 'G3', 'B-3', 'D4'],
+        ['F#3', 'A#3', 'C#4'],
+        ['C-4', 'E-4', 'G-4'],
+        ['E#3', 'G#3', 'B#3'],
+    ])
+    def test_fast_path_matches_music21(self, pitches):
+        """Tertian triads and seventh chords get music21's figure"""
+        c = chord.Chord(pitches)
+        assert _simple_figure(c) == harmony.chordSymbolFigureFromChord(c)
+    
+    @pytest.mark.parametrize("pitches", [
+        ['B-3', 'F4', 'C#5'],
+        ['F#3', 'A3', 'E-4'],
+        ['C4', 'F-4', 'G4'],
+        ['G#3', 'A-3', 'C4', 'E-4'],
+        ['C4', 'E4', 'G#4'],
+    ])
+    def test_enharmonic_spellings_use_music21(self, pitches):
+        """Chords that are not spelled as stacked thirds skip the fast path"""
+        c = chord.Chord(pitches)
+        assert _simple_figure(c) is None
+        [cs] = analyze_chords(_score_with_chords([pitches]))
+        assert cs.figure == harmony.chordSymbolFigureFromChord(chord.Chord(pitches))
@@ -0,0 +1,74 @@
+import copy
+import re
+
+from music21 import converter, note, spanner, stream
+from music21.musicxml.m21ToXml import GeneralObjectExporter
+
+from core.score.utils import fast_clone_score
+
+
+def _musicxml(score):
+    """MusicXML of a score without the generated id attributes"""
+    xml = GeneralObjectExporter(score).parse().decode('utf-8')
+    return re.sub(r' id="[^"]*"', '', xml)
+
+
+def _streams(score):
+    """All streams of a score, including spanner storage"""
+    streams = list(score.recurse(streamsOnly=True, includeSelf=True))
+    streams.extend(sp.spannerStorage for sp in score.spanners)
+    return streams
+
+
+class TestFastCloneScore:
+    """Test fast_clone_score against copy.deepcopy"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.score = converter.parse('examples/test.xml')
+        # The first eight measures keep the test fast
+        for part in self.score.parts:
+            part.remove(list(part.getElementsByClass(stream.Measure))[8:])
+        notes = list(self.score.parts[0].recurse().getElementsByClass(note.Note))
+        self.score.insert(0, spanner.Slur(notes[0], notes[1]))
+        self.original_xml = _musicxml(self.score)
+    
+    def test_musicxml_matches_deepcopy(self):
+        """The clone exports the same MusicXML as a deepcopy"""
+        clone = fast_clone_score(self.score)
+        assert _musicxml(clone) == _musicxml(copy.deepcopy(self.score))
+        assert _musicxml(clone) == self.original_xml
+    
+    def test_sites_point_into_clone(self):
+        """activeSite and all sites of every element belong to the clone"""
+        clone = fast_clone_score(self.score)
+        clone_streams = {id(s) for s in _streams(clone)}
+        original_streams = {id(s) for s in _streams(self.score)}
+        assert not clone_streams & original_streams
+        
+        # Iterating would set activeSite itself, so leave it untouched here
+        for element in clone.recurse(includeSelf=False, restoreActiveSites=False):
+            assert id(element.activeSite) in clone_streams
+            element.activeSite.elementOffset(element)
+            for site in element.sites.get(excludeNone=True):
+                assert id(site) in clone_streams
+        
+        clone_slur = clone.spanners.first()
+        clone_notes = set(map(id, clone.parts[0].recurse().notes))
+        for spanned in clone_slur.getSpannedElements():
+            assert id(spanned) in clone_notes
+            assert spanned.getSpannerSites() == [clone_slur]
+    
+    def test_editing_clone_leaves_original(self):
+        """Changes to the clone do not reach the original score"""
+        clone = fast_clone_score(self.score)
+        first_part = clone.parts[0]
+        first_note = first_part.recurse().getElementsByClass(note.Note).first()
+        first_note.pitch.transpose(2, inPlace=True)
+        first_measure = first_part.getElementsByClass(stream.Measure).first()
+        first_part.remove(first_measure)
+        clone.remove(clone.parts[-1])
+        clone.spanners.first().addSpannedElements(first_part.recurse().notes[5])
+        
+        assert _musicxml(self.score) == self.original_xml
+        assert _musicxml(clone) != self.original_xml
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+from music21 import chord, converter, harmony, meter, note, spanner, stream
+
+from core.score.writer import write_musicxml
+
+
+def _normalized(path):
+    """File content without generated ids and the encoding date"""
+    text = path.read_text(encoding='utf-8')
+    text = re.sub(r' id="[^"]*"', '', text)
+    return re.sub(r'<encoding-date>[^<]*</encoding-date>', '', text)
+
+
+def _example_score():
+    """First eight measures of the example chorale"""
+    score = converter.parse('examples/test.xml')
+    for part in score.parts:
+        part.remove(list(part.getElementsByClass(stream.Measure))[8:])
+    return score
+
+
+def _built_score():
+    """Unmeasured score that music21 has to make notation for"""
+    part = stream.Part()
+    part.append(meter.TimeSignature('3/4'))
+    part.append(harmony.ChordSymbol('F#m7'))
+    part.append(chord.Chord(['F#4', 'A4', 'C#5', 'E5'], quarterLength=2.5))
+    first, second = note.Note('B-4', quarterLength=1.5), note.Note('E#5', quarterLength=2)
+    part.append([first, second])
+    part.insert(0, spanner.Slur(first, second))
+    score = stream.Score()
+    score.insert(0, part)
+    return score
+
+
+class TestWriteMusicXML:
+    """Test write_musicxml against music21's own score.write output"""
+    
+    @pytest.mark.parametrize("make_score", [_example_score, _built_score])
+    def test_output_matches_score_write(self, tmp_path, make_score):
+        """Apart from ids and the date, the file equals score.write's"""
+        score = make_score()
+        ours = tmp_path / "ours.musicxml"
+        theirs = tmp_path / "theirs.musicxml"
+        
+        write_musicxml(score, ours)
+        score.write(fmt="musicxml", fp=str(theirs))
+        
+        assert _normalized(ours) == _normalized(theirs)
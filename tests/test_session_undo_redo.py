@@ -10,8 +10,8 @@ def main():
 
     # Simuliere Bearbeitung
     from core.score.reharmonize import replace_chord_in_measure
-    replace_chord_in_measure(session.current_score, 1, "Am")
-    session.apply_edit(session.current_score)
+    with session.mutate() as score:
+        replace_chord_in_measure(score, 1, "Am")
     print("Änderung 1 angewendet")
 
     # Undo
@@ -1,6 +1,14 @@
 from typing import List, Optional
 from fractions import Fraction
 from ikr_light import Score, Part, Voice, Measure, Event, NoteEvent, RestEvent, HarmonyEvent, LyricEvent
+from operator import attrgetter
+
+
+# Sort keys for deterministic output
+_by_name = attrgetter('name')
+_by_id = attrgetter('id')
+_by_number = attrgetter('number')
+_by_onset = attrgetter('onset')
 
 
 class TLRConverter:
@@ -11,25 +19,25 @@ class TLRConverter:
         lines = []
         
         # Sort parts by name for deterministic output
-        sorted_parts = sorted(score.parts, key=lambda p: p.name)
+        sorted_parts = sorted(score.parts, key=_by_name)
         
         for part in sorted_parts:
             lines.append(f"PART {part.name} ROLE {part.role}")
             
             # Sort voices by ID for deterministic output
-            sorted_voices = sorted(part.voices, key=lambda v: v.id)
+            sorted_voices = sorted(part.voices, key=_by_id)
             
             for voice in sorted_voices:
                 lines.append(f"VOICE {voice.id}")
                 
                 # Sort measures by number for deterministic output
-                sorted_measures = sorted(voice.measures, key=lambda m: m.number)
+                sorted_measures = sorted(voice.measures, key=_by_number)
                 
                 for measure in sorted_measures:
                     lines.append(f"MEASURE {measure.number} TIME {measure.time_signature}")
                     
                     # Sort events by onset for deterministic output
-                    sorted_events = sorted(measure.events, key=lambda e: e.onset)
+                    sorted_events = sorted(measure.events, key=_by_onset)
                     
                     for event in sorted_events:
                         line = self._event_to_tlr(event)
@@ -79,26 +87,48 @@ class TLRConverter:
     
     def _event_to_tlr(self, event: Event) -> Optional[str]:
         """Convert single event to TLR line with full explicit values"""
-        if isinstance(event, NoteEvent):
-            # Always include all attributes explicitly, no defaults
-            tie_str = f" tie={event.tie}" if event.tie is not None else ""
-            return f"NOTE t={event.onset} dur={event.duration} pitch={event.pitch_step}{event.octave}{self._alter_to_str(event.pitch_alter)}{tie_str}"
-        
-        elif isinstance(event, RestEvent):
-            # Always include both onset and duration explicitly
-            return f"REST t={event.onset} dur={event.duration}"
-        
-        elif isinstance(event, HarmonyEvent):
-            # Always include onset, symbol, and optional key explicitly
-            key_part = f" key={event.key}" if event.key else ""
-            return f"HARMONY t={event.onset} symbol={event.harmony}{key_part}"
-        
-        elif isinstance(event, LyricEvent):
-            # Always include both onset and text explicitly
-            return f"LYRIC t={event.onset} text={event.text}"
-        
+        # Dispatch on the exact event type; subclasses use their base's formatter
+        formatter = self._EVENT_FORMATTERS.get(type(event))
+        if formatter is None:
+            formatter = self._inherited_formatter(type(event))
+            if formatter is None:
+                return None
+        return formatter(self, event)
+    
+    @classmethod
+    def _inherited_formatter(cls, event_type: type):
+        """Formatter of the nearest base class of an event type, if any"""
+        for base in event_type.__mro__[1:]:
+            formatter = cls._EVENT_FORMATTERS.get(base)
+            if formatter is not None:
+                return formatter
         return None
     
+    def _note_to_tlr(self, event: NoteEvent) -> str:
+        # Always include all attributes explicitly, no defaults
+        tie_str = f" tie={event.tie}" if event.tie is not None else ""
+        return f"NOTE t={event.onset} dur={event.duration} pitch={event.pitch_step}{event.octave}{self._alter_to_str(event.pitch_alter)}{tie_str}"
+    
+    def _rest_to_tlr(self, event: RestEvent) -> str:
+        # Always include both onset and duration explicitly
+        return f"REST t={event.onset} dur={event.duration}"
+    
+    def _harmony_to_tlr(self, event: HarmonyEvent) -> str:
+        # Always include onset, symbol, and optional key explicitly
+        key_part = f" key={event.key}" if event.key else ""
+        return f"HARMONY t={event.onset} symbol={event.harmony}{key_part}"
+    
+    def _lyric_to_tlr(self, event: LyricEvent) -> str:
+        # Always include both onset and text explicitly
+        return f"LYRIC t={event.onset} text={event.text}"
+    
+    _EVENT_FORMATTERS = {
+        NoteEvent: _note_to_tlr,
+        RestEvent: _rest_to_tlr,
+        HarmonyEvent: _harmony_to_tlr,
+        LyricEvent: _lyric_to_tlr,
+    }
+    
     def _alter_to_str(self, alter: int) -> str:
         """Convert pitch alteration to Scientific Pitch Notation string"""
         if alter == 1: